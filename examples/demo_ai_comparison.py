@@ -19,13 +19,35 @@ Environment:
     # Ollama: No API key needed, runs locally
 """
 
-from tarotcli.ai import interpret_reading_sync
+import asyncio
+
+from tarotcli.ai import interpret_reading
 from tarotcli.config import get_config
 from tarotcli.deck import TarotDeck
-from tarotcli.models import FocusArea
+from tarotcli.models import FocusArea, Reading
 from tarotcli.spreads import get_spread
 
 
+async def _run_both(reading: Reading) -> tuple[str, str]:
+    """Interpret reading with Claude and Ollama concurrently.
+
+    Both provider calls are independent, so they run under a single
+    asyncio.gather() - wall time is max(claude, ollama) rather than the sum.
+    return_exceptions=True keeps one provider's failure from discarding the
+    other's result; any exception maps back to the static interpretation.
+    """
+    results = await asyncio.gather(
+        interpret_reading(reading, provider="claude"),
+        interpret_reading(reading, provider="ollama"),
+        return_exceptions=True,
+    )
+    claude, ollama = (
+        reading.static_interpretation if isinstance(r, BaseException) else r
+        for r in results
+    )
+    return claude, ollama
+
+
 def test_cloud_vs_local_comparison():
     """Compare Claude (cloud) vs Ollama (local) interpretations."""
 
@@ -71,10 +93,11 @@ def test_cloud_vs_local_comparison():
 
     # Use three-card spread for quick comparison
     spread = get_spread("three")
-    print(f"✅ Using {spread.display_name} ({spread.card_count()} cards)")
+    card_count = spread.card_count()
+    print(f"✅ Using {spread.display_name} ({card_count} cards)")
 
     # Draw cards
-    drawn = deck.draw(spread.card_count())
+    drawn = deck.draw(card_count)
     print(f"✅ Drew {len(drawn)} cards:")
     for card in drawn:
         orientation = "↓ Reversed" if card.reversed else "↑ Upright"
@@ -100,17 +123,22 @@ def test_cloud_vs_local_comparison():
     print("\n" + "=" * 70)
     print("BASELINE INTERPRETATION (No AI)")
     print("=" * 70)
-    print(reading.baseline_interpretation)
+    print(reading.static_interpretation)
 
-    # Get Claude interpretation
+    # Get both interpretations concurrently (independent API calls)
     print("\n" + "=" * 70)
-    print("CLAUDE INTERPRETATION (Cloud)")
+    print("CALLING PROVIDERS (Concurrently)")
     print("=" * 70)
-    print("🤖 Calling Claude API...")
+    print("🤖 Calling Claude API and Ollama local server...")
+
+    claude_interpretation, ollama_interpretation = asyncio.run(_run_both(reading))
 
-    claude_interpretation = interpret_reading_sync(reading, provider="claude")
+    # Claude interpretation
+    print("\n" + "=" * 70)
+    print("CLAUDE INTERPRETATION (Cloud)")
+    print("=" * 70)
 
-    if claude_interpretation == reading.baseline_interpretation:
+    if claude_interpretation == reading.static_interpretation:
         print("\n⚠️  Claude API call failed (graceful degradation to baseline)")
         print("   Check: ANTHROPIC_API_KEY environment variable")
     else:
@@ -118,15 +146,12 @@ def test_cloud_vs_local_comparison():
 
     print("\n" + claude_interpretation)
 
-    # Get Ollama interpretation
+    # Ollama interpretation
     print("\n" + "=" * 70)
     print("OLLAMA INTERPRETATION (Local)")
     print("=" * 70)
-    print("🤖 Calling Ollama local server...")
-
-    ollama_interpretation = interpret_reading_sync(reading, provider="ollama")
 
-    if ollama_interpretation == reading.baseline_interpretation:
+    if ollama_interpretation == reading.static_interpretation:
         print("\n⚠️  Ollama API call failed (graceful degradation to baseline)")
         print("   Check: 1) ollama serve is running")
         print("          2) Model is pulled: ollama pull deepseek-r1:8b")
@@ -141,8 +166,8 @@ def test_cloud_vs_local_comparison():
     print("COMPARISON SUMMARY")
     print("=" * 70)
 
-    claude_worked = claude_interpretation != reading.baseline_interpretation
-    ollama_worked = ollama_interpretation != reading.baseline_interpretation
+    claude_worked = claude_interpretation != reading.static_interpretation
+    ollama_worked = ollama_interpretation != reading.static_interpretation
 
     print(
         f"\nClaude (cloud):  {'✅ Success' if claude_worked else '❌ Failed (used baseline)'}"
@@ -50,10 +50,11 @@ def test_ai_interpretation():
 
     # Get spread layout
     spread = get_spread("three")
-    print(f"✅ Using {spread.display_name} ({spread.card_count()} cards)")
+    card_count = spread.card_count()
+    print(f"✅ Using {spread.display_name} ({card_count} cards)")
 
     # Draw cards
-    drawn = deck.draw(spread.card_count())
+    drawn = deck.draw(card_count)
     print(f"✅ Drew {len(drawn)} cards:")
     for card in drawn:
         orientation = "↓ Reversed" if card.reversed else "↑ Upright"
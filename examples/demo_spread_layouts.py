@@ -24,10 +24,11 @@ def test_spread_operations():
 
     # Get spread layout
     spread = get_spread("three")
-    print(f"✅ Using {spread.display_name} ({spread.card_count()} cards)")
+    card_count = spread.card_count()
+    print(f"✅ Using {spread.display_name} ({card_count} cards)")
 
     # Draw cards
-    drawn = deck.draw(spread.card_count())
+    drawn = deck.draw(card_count)
     print(f"✅ Drew {len(drawn)} cards")
 
     # Create reading with baseline interpretation
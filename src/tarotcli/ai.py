@@ -1,8 +1,27 @@
 import asyncio
-from typing import Optional
-from litellm import acompletion
+import atexit
+import collections
+import concurrent.futures
+import functools
+import importlib.util
+import random
+import threading
+import weakref
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterator,
+    Optional,
+    TypeVar,
+)
+
+from tarotcli.cache import InterpretationCache
 from tarotcli.models import Reading, FocusArea
-from tarotcli.config import get_config
+from tarotcli.spreads import SPREADS
+from tarotcli.config import Config, get_config
 
 # Focus area context templates
 FOCUS_CONTEXTS = {
@@ -32,6 +51,58 @@ FOCUS_CONTEXTS = {
     ),
 }
 
+# Card orientation labels indexed by DrawnCard.reversed (False=0, True=1)
+_ORIENTATIONS = ("Upright", "Reversed")
+
+# Interpretation guidelines shared by every prompt (invariant, built once)
+_PROMPT_GUIDELINES = "\n".join(
+    [
+        "Please provide a cohesive interpretation that:",
+        "1. Addresses the focus area and question (if provided)",
+        "2. Integrates the cards' positions and traditional meanings",
+        "3. References specific symbolic elements from the imagery descriptions",
+        "   (serpents, robes, objects, colors, positioning)",
+        "4. Offers practical, grounded insight for the querent's situation",
+        "5. Maintains respect for traditional tarot symbolism",
+        "\nKeep the interpretation concise (200-300 words) and actionable.",
+    ]
+)
+
+# System prompt per FocusArea: everything that doesn't depend on the cards.
+# Sent first and byte-identical across readings, so providers that reuse a
+# matching prompt prefix (e.g. Ollama's KV cache) can.
+_SYSTEM_PROMPTS = {
+    focus_area: "\n".join(
+        [
+            "Provide a tarot reading interpretation for the spread that follows.\n",
+            f"**Focus Area**: {context}\n",
+            _PROMPT_GUIDELINES,
+        ]
+    )
+    for focus_area, context in FOCUS_CONTEXTS.items()
+}
+
+_T = TypeVar("_T")
+
+# Retry policy for _call_llm: delays ~0.5s, 1s, 2s (capped at 8s), each
+# scaled by a random factor in [0.5, 1] so concurrent retries spread out
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 8.0
+
+# Native SDK clients pooled per event loop (see _native_client)
+_native_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Providers already reported as missing an API key (see _missing_api_key)
+_warned_missing_key: set[str] = set()
+
+# Persistent event loop for the sync wrappers (see _get_loop)
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
 
 async def interpret_reading(
     reading: Reading, provider: Optional[str] = None, timeout: int = 30
@@ -71,6 +142,31 @@ async def interpret_reading(
         interpret_reading_sync(). Over-engineered for v1.0 but architecturally
         sound for planned web trajectory.
     """
+    resolved_provider, model_config, api_key = _resolve_provider(provider)
+
+    # Check API key requirement (Ollama doesn't need one, others do)
+    if _missing_api_key(resolved_provider, api_key):
+        return reading.static_interpretation
+
+    return await _interpret(
+        reading, resolved_provider, model_config, api_key, timeout, _get_cache()
+    )
+
+
+def _resolve_provider(provider: Optional[str]) -> tuple[str, dict, Optional[str]]:
+    """Resolve provider name, model config, and API key from config.
+
+    Resolved on every call rather than memoized: Config.get() and the API
+    key lookup read the environment each time, so a key or provider
+    override exported mid-session applies to the next reading.
+
+    Args:
+        provider: Model provider name, or None for the configured default.
+
+    Returns:
+        Tuple of (resolved_provider, model_config, api_key). Treat
+        model_config as read-only - it belongs to the loaded config.
+    """
     config = get_config()
 
     # Resolve provider to concrete name (handles None → default from config)
@@ -84,114 +180,771 @@ async def interpret_reading(
     model_config = config.get_model_config(resolved_provider)
     api_key = config.get_api_key(resolved_provider)
 
-    # Check API key requirement (Ollama doesn't need one, others do)
-    if not api_key and resolved_provider != "ollama":
+    return resolved_provider, model_config, api_key
+
+
+def _missing_api_key(provider: str, api_key: Optional[str]) -> bool:
+    """True if provider needs an API key and none is configured.
+
+    Ollama runs locally and needs none. The notice is printed once per
+    provider per process, not once per reading, so batch and repeated
+    interactive readings without a key don't repeat it.
+    """
+    if api_key or provider == "ollama":
+        return False
+
+    if provider not in _warned_missing_key:
+        _warned_missing_key.add(provider)
         print(
-            f"❌ No API key found for provider '{resolved_provider}', using static interpretation"
+            f"❌ No API key found for provider '{provider}', using static interpretation"
         )
-        return reading.static_interpretation
+    return True
+
+
+def _get_cache() -> Optional[InterpretationCache]:
+    """Return the interpretation cache if enabled in config, else None.
+
+    Controlled by ai.cache_enabled (default: false), ai.cache_ttl (seconds,
+    null = never expire) and ai.cache_max_entries (default 1000).
+    """
+    return _cache_for(get_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_for(config: Config) -> Optional[InterpretationCache]:
+    """Build one cache per config instance so its in-memory index persists."""
+    if config.get("ai.cache_enabled", False) is not True:
+        return None
+    return InterpretationCache(
+        config.get_cache_path(),
+        ttl=config.get("ai.cache_ttl"),
+        max_entries=config.get("ai.cache_max_entries", 1000),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cache_key(provider: str, model: str, system: str, prompt: str) -> str:
+    """Return the response cache key for a (provider, model, prompt) triple.
+
+    Memoized so re-interpreting a reading reuses the digest instead of
+    joining, UTF-8 encoding and hashing the full prompt again. The prompt
+    strings come from _build_prompt_parts' own cache, so lookups here hash
+    strings whose hash Python has already stored.
+    """
+    return InterpretationCache.make_key(provider, model, f"{system}\n{prompt}")
+
 
+async def _interpret(
+    reading: Reading,
+    provider: str,
+    model_config: dict,
+    api_key: Optional[str],
+    timeout: int,
+    cache: Optional[InterpretationCache] = None,
+    errors: Optional[list[str]] = None,
+) -> str:
+    """Build prompt and call the LLM, degrading to static interpretation on error.
+
+    Shared by interpret_reading() and interpret_many() so provider resolution
+    and API key checks happen once per call site, not once per reading.
+
+    The timeout is enforced twice: passed to the provider call, and as an
+    asyncio.wait_for() deadline over the whole call including retries, so no
+    backend can hold a reading past it.
+
+    Failures are reported with a print, or, when an errors list is given,
+    appended to it as an error type name so a batch can report them in one
+    summary line. Only Exception subclasses degrade; cancellation and
+    KeyboardInterrupt (BaseException) propagate.
+
+    When a cache is given, identical (provider, model, prompt) triples are
+    served from it without an API call; the prompt here is the system and
+    user text together. Only real LLM responses are cached,
+    never static fallbacks.
+    """
     try:
-        prompt = _build_interpretation_prompt(reading)
-
-        response = await acompletion(
-            model=model_config["model"],  # From config
-            messages=[{"role": "user", "content": prompt}],
-            timeout=timeout,
-            temperature=model_config.get("temperature", 0.7),
-            max_tokens=model_config.get("max_tokens", 2000),  # From config
-            api_base=model_config.get("api_base"),  # From config
-            stream=False,  # Disable streaming for synchronous response
+        system, prompt = _build_prompt_parts(reading)
+
+        key = None
+        if cache is not None:
+            key = _cache_key(provider, model_config["model"], system, prompt)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Overall deadline covering rate-limit retries and backoff as well
+        interpretation = await asyncio.wait_for(
+            _call_llm(system, prompt, provider, model_config, api_key, timeout),
+            timeout,
         )
-
-        # Extract content from response, with fallback to baseline
-        # type: ignore - LiteLLM doesn't properly type streaming vs non-streaming responses
-        interpretation = response.choices[0].message.content  # type: ignore[union-attr]
         if interpretation is None:
             return reading.static_interpretation
 
+        if cache is not None and key is not None:
+            cache.set(key, interpretation)
+
         return interpretation
 
     except asyncio.TimeoutError:
-        print(f"API timeout after {timeout}s, using static interpretation")
+        if errors is not None:
+            errors.append("TimeoutError")
+        else:
+            print(f"API timeout after {timeout}s, using static interpretation")
         return reading.static_interpretation
 
     except Exception as e:
-        print(f"API error ({type(e).__name__}), using static interpretation")
+        if errors is not None:
+            errors.append(type(e).__name__)
+        else:
+            print(f"API error ({type(e).__name__}), using static interpretation")
         return reading.static_interpretation
 
 
+async def _call_llm(
+    system: str,
+    prompt: str,
+    provider: str,
+    model_config: dict,
+    api_key: Optional[str],
+    timeout: int,
+) -> Optional[str]:
+    """Send a single prompt to the configured model.
+
+    Uses the provider's native SDK when models.backend is "native" and the
+    SDK is installed (see _PROVIDER_BACKENDS); otherwise goes through LiteLLM.
+
+    Args:
+        system: Reading-independent system prompt (see _SYSTEM_PROMPTS).
+        prompt: Reading-specific user prompt (spread, question, cards).
+        provider: Resolved provider name (claude, ollama).
+        model_config: Provider config (model, temperature, max_tokens, api_base,
+            request_timeout).
+        api_key: Provider API key, or None for local providers.
+        timeout: API call timeout in seconds; also the per-attempt limit
+            when request_timeout is unset.
+
+    Returns:
+        Response text, or None if the model returned no content.
+
+    Rate-limited (HTTP 429) and timed-out attempts are retried with jittered
+    exponential backoff (see _RETRY_ATTEMPTS); all other errors propagate
+    immediately.
+
+    Each attempt is limited to the provider's request_timeout when set
+    (e.g. 8s for a provider whose responses usually take 2-5s), so a
+    stalled request is abandoned and retried instead of holding the reading
+    for the full timeout. Without it, one attempt may use the whole timeout.
+    The caller's overall deadline still bounds all attempts together.
+
+    Raises:
+        Any SDK/LiteLLM/network exception - callers handle degradation.
+    """
+    backend = _native_backend(provider) or _call_litellm
+    request_timeout = model_config.get("request_timeout")
+    attempt_timeout = min(request_timeout, timeout) if request_timeout else timeout
+
+    attempt = 0
+    while True:
+        try:
+            return await asyncio.wait_for(
+                backend(system, prompt, model_config, api_key, attempt_timeout),
+                attempt_timeout,
+            )
+        except Exception as e:
+            attempt += 1
+            if attempt >= _RETRY_ATTEMPTS or not _is_retryable(
+                e, retry_timeouts=bool(request_timeout)
+            ):
+                raise
+            delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2 ** (attempt - 1))
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+
+def _is_retryable(error: Exception, retry_timeouts: bool) -> bool:
+    """True if error is a rate limit (HTTP 429), or a timeout when retrying them.
+
+    Timeouts are only worth retrying when attempts are shorter than the
+    overall deadline (request_timeout set); otherwise no time is left.
+
+    Checks status_code rather than exception classes so LiteLLM, Anthropic,
+    and Ollama errors are all recognised without importing any of them
+    (LiteLLM and Anthropic report timeouts as 408).
+    """
+    status_code = getattr(error, "status_code", None)
+    if status_code == 429:
+        return True
+    return retry_timeouts and (
+        isinstance(error, asyncio.TimeoutError) or status_code == 408
+    )
+
+
+async def acompletion(**kwargs):
+    """Lazy proxy for litellm.acompletion().
+
+    Importing LiteLLM costs seconds (it loads every provider module), so it
+    is deferred until the first real API call. Readings that never reach the
+    API (--no-ai, missing key, cache hit) never pay for it.
+    """
+    return await _load_litellm().acompletion(**kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_litellm():
+    """Import and configure LiteLLM once, on first use."""
+    import litellm
+
+    # Skip LiteLLM's per-call debug/help banners on errors
+    litellm.suppress_debug_info = True
+    return litellm
+
+
+def provider_errors() -> tuple[type[Exception], ...]:
+    """Exception types that mean a provider call failed, rather than a bug.
+
+    Covers LiteLLM's API errors (subclasses of the openai package's
+    OpenAIError, which LiteLLM depends on), timeouts, and network errors
+    LiteLLM didn't wrap. Never imports LiteLLM: if it isn't loaded yet,
+    none of its errors can have been raised.
+
+    Example:
+        >>> try:
+        ...     text = "".join(interpret_reading_stream_sync(reading))
+        ... except provider_errors() as e:
+        ...     print(f"API error ({type(e).__name__})")
+    """
+    if not _load_litellm.cache_info().currsize:
+        return (asyncio.TimeoutError, OSError)
+    from openai import OpenAIError
+
+    return (OpenAIError, asyncio.TimeoutError, OSError)
+
+
+def prewarm() -> None:
+    """Start importing LiteLLM on a background thread and return immediately.
+
+    The first API call otherwise pays the LiteLLM import (seconds) only
+    after the reading has been drawn. Calling this early - before deck
+    loading or interactive prompts - overlaps that cost with other work.
+    Makes no API calls; safe to call repeatedly.
+
+    Example:
+        >>> prewarm()  # at command start
+        >>> ...  # draw cards, prompt user
+        >>> interpret_reading_sync(reading)  # LiteLLM already loaded
+    """
+    if _load_litellm.cache_info().currsize:
+        return
+    threading.Thread(
+        target=_load_litellm, name="tarotcli-litellm-prewarm", daemon=True
+    ).start()
+
+
+async def _call_litellm(
+    system: str,
+    prompt: str,
+    model_config: dict,
+    api_key: Optional[str],
+    timeout: int,
+) -> Optional[str]:
+    """Send a single prompt to the configured model via LiteLLM.
+
+    Default backend, and fallback when a native SDK isn't installed.
+    """
+    response = await acompletion(
+        **_completion_kwargs(system, prompt, model_config, api_key, timeout),
+        stream=False,  # Disable streaming for synchronous response
+    )
+
+    # type: ignore - LiteLLM doesn't properly type streaming vs non-streaming responses
+    return response.choices[0].message.content  # type: ignore[union-attr]
+
+
+def _completion_kwargs(
+    system: str,
+    prompt: str,
+    model_config: dict,
+    api_key: Optional[str],
+    timeout: int,
+) -> dict:
+    """LiteLLM acompletion() arguments shared by blocking and streaming calls.
+
+    The system prompt (~200 tokens) is sent as a plain system message: it
+    is below Anthropic's minimum cacheable prefix (1024 tokens for Sonnet),
+    so a cache_control marker would change the request without effect.
+    """
+    return {
+        "model": model_config["model"],  # From config
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ],
+        "timeout": timeout,
+        "temperature": model_config.get("temperature", 0.7),
+        "max_tokens": model_config.get("max_tokens", 2000),  # From config
+        "api_base": model_config.get("api_base"),  # From config
+        "api_key": api_key,
+    }
+
+
+def _strip_provider_prefix(model: str) -> str:
+    """Drop LiteLLM routing prefix (e.g. "ollama_chat/") for native SDKs."""
+    return model.split("/", 1)[-1]
+
+
+def _native_client(key: tuple, factory: Callable[[], Any]) -> Any:
+    """Return a pooled native SDK client for the running loop.
+
+    SDK clients wrap an httpx connection pool, which binds to the event loop
+    that first uses it. Caching one client per (loop, key) lets repeated
+    calls reuse keep-alive TCP/TLS connections instead of paying a fresh
+    handshake per reading. The LiteLLM path gets the same effect from
+    LiteLLM's own per-loop client cache plus the persistent _get_loop().
+
+    Args:
+        key: Identifies client configuration (SDK, credentials, host).
+        factory: Builds a new client when none is cached.
+
+    Returns:
+        Cached or newly created client.
+    """
+    clients = _native_clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = factory()
+    return client
+
+
+async def _call_claude(
+    system: str,
+    prompt: str,
+    model_config: dict,
+    api_key: Optional[str],
+    timeout: int,
+) -> Optional[str]:
+    """Send prompt via the Anthropic SDK (requires `anthropic` package)."""
+    import anthropic
+
+    client = _native_client(
+        ("anthropic", api_key), lambda: anthropic.AsyncAnthropic(api_key=api_key)
+    )
+    message = await client.messages.create(
+        model=_strip_provider_prefix(model_config["model"]),
+        system=system,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=model_config.get("temperature", 0.7),
+        max_tokens=model_config.get("max_tokens", 2000),
+        timeout=timeout,
+    )
+
+    text = "".join(block.text for block in message.content if block.type == "text")
+    return text or None
+
+
+async def _call_ollama(
+    system: str,
+    prompt: str,
+    model_config: dict,
+    api_key: Optional[str],
+    timeout: int,
+) -> Optional[str]:
+    """Send prompt via the Ollama Python client (requires `ollama` package)."""
+    import ollama
+
+    host = model_config.get("api_base")
+    client = _native_client(
+        ("ollama", host, timeout),
+        lambda: ollama.AsyncClient(host=host, timeout=timeout),
+    )
+    response = await client.chat(
+        model=_strip_provider_prefix(model_config["model"]),
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ],
+        options={
+            "temperature": model_config.get("temperature", 0.8),
+            "num_predict": model_config.get("max_tokens", 1500),
+        },
+    )
+    return response.message.content or None
+
+
+# Native SDK backends: (module required, call function) per provider
+_Backend = Callable[[str, str, dict, Optional[str], int], Awaitable[Optional[str]]]
+_PROVIDER_BACKENDS: dict[str, tuple[str, _Backend]] = {
+    "claude": ("anthropic", _call_claude),
+    "ollama": ("ollama", _call_ollama),
+}
+
+
+def _native_backend(provider: str) -> Optional[_Backend]:
+    """Return native SDK call for provider, or None to use LiteLLM.
+
+    Opt-in via models.backend: "native" (default "litellm"). Falls back to
+    LiteLLM if the provider has no native backend or its SDK isn't installed
+    (pip install anthropic / ollama).
+    """
+    if get_config().get("models.backend", "litellm") != "native":
+        return None
+
+    entry = _PROVIDER_BACKENDS.get(provider)
+    if entry is None:
+        return None
+
+    module_name, call = entry
+    if importlib.util.find_spec(module_name) is None:
+        return None
+
+    return call
+
+
+async def interpret_many(
+    readings: list[Reading],
+    provider: Optional[str] = None,
+    max_concurrency: Optional[int] = None,
+    timeout: int = 30,
+) -> list[str]:
+    """Interpret several readings concurrently with bounded parallelism.
+
+    Issues one LLM call per reading under asyncio.gather(), limited by an
+    asyncio.Semaphore so providers aren't flooded. Total latency is roughly
+    ceil(N / max_concurrency) round trips instead of N.
+
+    Same graceful degradation as interpret_reading(): every reading gets a
+    valid interpretation, falling back to its static_interpretation on error.
+    Failures are reported in a single summary line after the batch rather
+    than one line per reading.
+
+    Local backends: Ollama serves requests one at a time unless the server
+    is started with OLLAMA_NUM_PARALLEL set (e.g. OLLAMA_NUM_PARALLEL=4
+    ollama serve). Without it, concurrent requests simply queue server-side.
+
+    Args:
+        readings: Readings to interpret.
+        provider: Model provider name (claude, ollama). If None, uses config default.
+        max_concurrency: Maximum number of in-flight API calls. If None, uses
+            config ai.max_concurrency (default 8).
+        timeout: Per-call API timeout in seconds. Default 30s.
+
+    Returns:
+        list[str]: One interpretation per reading, in input order.
+
+    Example:
+        >>> interpretations = await interpret_many(readings, provider="claude")
+        >>> for reading, text in zip(readings, interpretations):
+        ...     reading.interpretation = text
+    """
+    if not readings:
+        return []
+
+    resolved_provider, model_config, api_key = _resolve_provider(provider)
+
+    if _missing_api_key(resolved_provider, api_key):
+        return [reading.static_interpretation for reading in readings]
+
+    if max_concurrency is None:
+        max_concurrency = get_config().get("ai.max_concurrency", 8)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    cache = _get_cache()
+    errors: list[str] = []
+
+    async def _bounded(reading: Reading) -> str:
+        async with semaphore:
+            return await _interpret(
+                reading,
+                resolved_provider,
+                model_config,
+                api_key,
+                timeout,
+                cache,
+                errors,
+            )
+
+    results = await asyncio.gather(*(_bounded(reading) for reading in readings))
+
+    if errors:
+        counts = collections.Counter(errors)
+        summary = ", ".join(
+            name if n == 1 else f"{name} x{n}" for name, n in counts.items()
+        )
+        print(
+            f"API errors for {len(errors)} of {len(readings)} readings ({summary}), "
+            "using static interpretation"
+        )
+
+    return results
+
+
+async def interpret_reading_stream(
+    reading: Reading, provider: Optional[str] = None, timeout: int = 30
+) -> AsyncIterator[str]:
+    """Yield AI interpretation text incrementally as the model produces it.
+
+    Streaming counterpart to interpret_reading() for interactive display:
+    the first words appear after time-to-first-token rather than after the
+    whole response has been generated. Always goes through LiteLLM with
+    stream=True, regardless of models.backend.
+
+    Missing API keys yield the static interpretation as a single chunk, and
+    cache hits yield the cached text as a single chunk. A fully streamed
+    response is cached like a blocking one.
+
+    Unlike interpret_reading(), API errors propagate - possibly after some
+    chunks have been yielded - so the caller decides how to degrade (cli
+    falls back to interpret_reading_sync()). A stall of more than timeout
+    seconds between chunks raises asyncio.TimeoutError.
+
+    Args:
+        reading: Complete reading with cards, spread type, focus area.
+        provider: Model provider name (claude, ollama). If None, uses config default.
+        timeout: API call timeout, and maximum wait per chunk, in seconds.
+
+    Yields:
+        str: Non-empty text fragments, in order.
+
+    Example:
+        >>> async for chunk in interpret_reading_stream(reading):
+        ...     print(chunk, end="", flush=True)
+    """
+    resolved_provider, model_config, api_key = _resolve_provider(provider)
+
+    if _missing_api_key(resolved_provider, api_key):
+        yield reading.static_interpretation
+        return
+
+    system, prompt = _build_prompt_parts(reading)
+
+    cache = _get_cache()
+    key = None
+    if cache is not None:
+        key = _cache_key(resolved_provider, model_config["model"], system, prompt)
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    response = await acompletion(
+        **_completion_kwargs(system, prompt, model_config, api_key, timeout),
+        stream=True,
+    )
+
+    parts: list[str] = []
+    chunks = aiter(response)
+    while True:
+        try:
+            chunk = await asyncio.wait_for(anext(chunks), timeout)
+        except StopAsyncIteration:
+            break
+        # Some providers send a final usage-only chunk with no choices
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            yield delta
+
+    if cache is not None and key is not None and parts:
+        cache.set(key, "".join(parts))
+
+
 def _build_interpretation_prompt(reading: Reading) -> str:
     """
     Construct prompt for Claude API with full reading context.
 
     Builds structured prompt including:
     - Focus area framing
+    - Interpretation guidelines
     - User's specific question (if provided)
     - All drawn cards with positions and meanings
-    - Interpretation guidelines
 
     Args:
         reading: Complete reading to interpret
 
     Returns:
-        Formatted prompt string for LLM
+        Formatted prompt string for LLM (system and user parts together,
+        as used for cache keys and debug display)
 
     Note:
         This is internal implementation. Prompt engineering kept simple
         for v1.0 - avoid over-engineering with complex prompt templates.
+        API calls send the two parts as separate messages; see
+        _build_prompt_parts.
+    """
+    system, prompt = _build_prompt_parts(reading)
+    return f"{system}\n{prompt}"
+
+
+def _build_prompt_parts(reading: Reading) -> tuple[str, str]:
+    """Split prompt into (system, user) text for a reading.
+
+    The system part depends only on the focus area (see _SYSTEM_PROMPTS);
+    the user part carries spread type, question and cards. Memoized on the
+    reading's prompt-relevant content (see _build_user_prompt), so
+    re-interpreting the same reading reuses the built strings.
+    """
+    cards_key = tuple(
+        (
+            card.position_meaning,
+            card.card.name,
+            card.reversed,
+            card.card.description,
+            card.effective_meaning,
+        )
+        for card in reading.cards
+    )
+    return _SYSTEM_PROMPTS[reading.focus_area], _build_user_prompt(
+        reading.spread_type, reading.question, cards_key
+    )
+
+
+_CardKey = tuple[str, str, bool, str, str]
+
+
+@functools.lru_cache(maxsize=256)
+def _build_user_prompt(
+    spread_type: str,
+    question: Optional[str],
+    cards_key: tuple[_CardKey, ...],
+) -> str:
+    """Build user prompt from hashable reading content (Reading itself isn't hashable).
+
+    cards_key holds (position, name, reversed, description, meaning) per card.
+    """
+    return "\n".join(_iter_prompt_fragments(spread_type, question, cards_key))
+
+
+def _iter_prompt_fragments(
+    spread_type: str,
+    question: Optional[str],
+    cards_key: tuple[_CardKey, ...],
+) -> Iterator[str]:
+    """Yield user prompt lines in order for a single newline join.
+
+    Streams cached spread line, question, and one block per card without
+    building intermediate lists or nested joins.
     """
-    focus_context = FOCUS_CONTEXTS[reading.focus_area]
+    yield _spread_header(spread_type)
+
+    if question:
+        yield f"**Querent's Question**: {question}\n"
 
-    # Build cards section
-    cards_section = []
-    for card in reading.cards:
-        orientation = "Reversed" if card.reversed else "Upright"
-        meaning = card.effective_meaning
-        imagery = card.card.description
+    yield "**Cards Drawn**:"
 
-        cards_section.append(
-            f"**{card.position_meaning}**: {card.card.name} ({orientation})\n"
-            f"Imagery: {imagery}\n"
+    for position, name, reversed_, description, meaning in cards_key:
+        yield (
+            f"**{position}**: {name} ({_ORIENTATIONS[reversed_]})\n"
+            f"Imagery: {description}\n"
             f"Traditional Meaning: {meaning}\n"
         )
 
-    cards_text = "\n".join(cards_section)
 
-    # Build full prompt
-    prompt_parts = [
-        "Provide a tarot reading interpretation for the following spread.\n",
-        f"**Spread Type**: {reading.spread_type.replace('_', ' ').title()}",
-        f"**Focus Area**: {focus_context}\n",
-    ]
+def _spread_header(spread_type: str) -> str:
+    """Return the spread type line that opens the user prompt.
 
-    if reading.question:
-        prompt_parts.append(f"**Querent's Question**: {reading.question}\n")
+    Built-in spreads are served from _SPREAD_HEADERS (built at import);
+    other spread types render on first use and are cached.
+    """
+    header = _SPREAD_HEADERS.get(spread_type)
+    if header is None:
+        header = _render_spread_header(spread_type)
+    return header
 
-    prompt_parts.extend(
-        [
-            "**Cards Drawn**:",
-            cards_text,
-            "\nPlease provide a cohesive interpretation that:",
-            "1. Addresses the focus area and question (if provided)",
-            "2. Integrates the cards' positions and traditional meanings",
-            "3. References specific symbolic elements from the imagery descriptions",
-            "   (serpents, robes, objects, colors, positioning)",
-            "4. Offers practical, grounded insight for the querent's situation",
-            "5. Maintains respect for traditional tarot symbolism",
-            "\nKeep the interpretation concise (200-300 words) and actionable.",
-        ]
-    )
 
-    return "\n".join(prompt_parts)
+@functools.lru_cache(maxsize=32)
+def _render_spread_header(spread_type: str) -> str:
+    """Build spread type line, e.g. "**Spread Type**: Three Card"."""
+    return f"**Spread Type**: {spread_type.replace('_', ' ').title()}\n"
+
+
+# Spread type lines for every built-in spread (built once at import)
+_SPREAD_HEADERS = {
+    layout.name: _render_spread_header(layout.name) for layout in SPREADS.values()
+}
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the persistent background event loop, starting it on first use.
+
+    The loop runs forever in a daemon thread. Sync wrappers submit coroutines
+    to it instead of calling asyncio.run(), which would create and tear down
+    a fresh loop per call. LiteLLM caches its pooled HTTP clients per event
+    loop, so reusing one loop keeps TLS connections warm across calls.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running background loop.
+    """
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="tarotcli-ai-loop", daemon=True
+            )
+            thread.start()
+            _loop, _loop_thread = loop, thread
+            atexit.register(_shutdown_loop)
+    return _loop
+
+
+def _shutdown_loop() -> None:
+    """Stop and close the background loop at interpreter exit."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop, _loop_thread = None, None
+
+    if loop is None or thread is None:
+        return
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=1)
+    if not loop.is_running():
+        loop.close()
+
+
+def _run_sync(coro: Coroutine[Any, Any, _T]) -> _T:
+    """Run coroutine to completion from synchronous code.
+
+    Works whether or not the caller already has a running event loop
+    (Jupyter, FastAPI handlers, pytest-asyncio) - unlike asyncio.run(),
+    which raises in that case. The coroutine runs on the background loop
+    and the calling thread blocks for its result.
+
+    If called from a coroutine already running *on* the background loop,
+    blocking would deadlock it, so the coroutine is run on a short-lived
+    worker thread with its own loop instead.
+
+    Args:
+        coro: Coroutine to execute.
+
+    Returns:
+        The coroutine's result.
+    """
+    loop = _get_loop()
+
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+
+    if running is loop:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
 
 
 def interpret_reading_sync(reading: Reading, **kwargs) -> str:
     """
     Synchronous wrapper for interpret_reading().
 
-    Convenience function for non-async contexts. Creates event loop,
-    runs async interpret_reading(), returns result.
+    Convenience function for non-async contexts. Submits interpret_reading()
+    to a persistent background event loop and blocks for the result, so
+    repeated calls reuse LiteLLM's connection pool rather than paying
+    connection setup each time. Safe to call with an event loop already
+    running (e.g. Jupyter), though async callers should simply await
+    interpret_reading() instead.
 
     Args:
         reading: Reading to interpret
@@ -203,4 +956,65 @@ def interpret_reading_sync(reading: Reading, **kwargs) -> str:
     Example:
         >>> interpretation = interpret_reading_sync(reading)
     """
-    return asyncio.run(interpret_reading(reading, **kwargs))
+    return _run_sync(interpret_reading(reading, **kwargs))
+
+
+def interpret_many_sync(readings: list[Reading], **kwargs) -> list[str]:
+    """
+    Synchronous wrapper for interpret_many().
+
+    Args:
+        readings: Readings to interpret
+        **kwargs: Passed to interpret_many()
+
+    Returns:
+        List of interpretation strings, in input order
+
+    Example:
+        >>> interpretations = interpret_many_sync(readings, max_concurrency=4)
+    """
+    return _run_sync(interpret_many(readings, **kwargs))
+
+
+def interpret_reading_stream_sync(reading: Reading, **kwargs) -> Iterator[str]:
+    """
+    Synchronous wrapper for interpret_reading_stream().
+
+    Steps the async stream on the persistent background loop (see _run_sync)
+    one chunk at a time, so the calling thread can render each chunk as it
+    arrives. Closing the iterator early closes the underlying stream.
+    Async callers should iterate interpret_reading_stream() directly.
+
+    Args:
+        reading: Reading to interpret
+        **kwargs: Passed to interpret_reading_stream()
+
+    Yields:
+        Interpretation text fragments, in order
+
+    Example:
+        >>> for chunk in interpret_reading_stream_sync(reading):
+        ...     print(chunk, end="", flush=True)
+    """
+    loop = _get_loop()
+    stream = interpret_reading_stream(reading, **kwargs)
+    try:
+        while True:
+            chunk = asyncio.run_coroutine_threadsafe(_next_chunk(stream), loop).result()
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        asyncio.run_coroutine_threadsafe(stream.aclose(), loop).result()
+
+
+async def _next_chunk(stream: AsyncIterator[str]) -> Optional[str]:
+    """Advance stream by one chunk, returning None when exhausted.
+
+    StopAsyncIteration can't cross a concurrent.futures.Future cleanly, so
+    exhaustion is signalled with None instead.
+    """
+    try:
+        return await anext(stream)
+    except StopAsyncIteration:
+        return None
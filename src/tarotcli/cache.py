@@ -0,0 +1,190 @@
+"""Response cache for AI interpretations.
+
+Stores completed LLM interpretations keyed by a hash of (provider, model,
+prompt) so identical readings (e.g. a fixed shuffle seed) skip the API
+round trip entirely on repeat runs.
+
+Design principles:
+- Graceful degradation: Cache failures never block readings
+- Minimal complexity: JSONL file, no database
+- User control: Opt-in via config (ai.cache_enabled, default: disabled)
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+class InterpretationCache:
+    """Append-only JSONL cache of AI interpretations.
+
+    Each line holds one entry: {"key", "created", "interpretation"}. Later
+    entries for the same key supersede earlier ones, so writes never need
+    to rewrite the file.
+
+    The file is read once on first use into an in-memory LRU map; lookups
+    after that never touch disk. Entries beyond max_entries are evicted
+    least-recently-used first, and the file is compacted on the next
+    hydration if it holds stale or evicted lines.
+
+    Storage location determined by Config.get_cache_path():
+    - Linux: ~/.cache/tarotcli/interpretations.jsonl
+    - macOS: ~/Library/Caches/tarotcli/interpretations.jsonl
+    - Windows: C:\\Users\\<user>\\AppData\\Local\\tarotcli\\Cache\\interpretations.jsonl
+
+    Usage:
+        >>> cache = InterpretationCache(path, ttl=86400)
+        >>> key = InterpretationCache.make_key("claude", model, prompt)
+        >>> cache.get(key)  # None on miss or expiry
+        >>> cache.set(key, interpretation)
+    """
+
+    def __init__(
+        self, cache_path: Path, ttl: Optional[float] = None, max_entries: int = 1000
+    ):
+        """Initialize cache at the given path.
+
+        Args:
+            cache_path: Path to the JSONL cache file.
+            ttl: Entry lifetime in seconds. None means entries never expire.
+            max_entries: Maximum entries kept before LRU eviction.
+        """
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Optional[OrderedDict[str, tuple[float, str]]] = None
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str) -> str:
+        """Build a cache key from provider, model, and full prompt text.
+
+        Args:
+            provider: Resolved provider name (claude, ollama).
+            model: Model identifier from provider config.
+            prompt: Fully built interpretation prompt.
+
+        Returns:
+            str: 32-character hex digest.
+        """
+        return hashlib.blake2b(
+            f"{provider}|{model}|{prompt}".encode("utf-8"), digest_size=16
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached interpretation for key, or None on miss/expiry.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            Optional[str]: Cached interpretation, or None.
+        """
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is None:
+            return None
+
+        created, interpretation = entry
+        if self._expired(created):
+            del entries[key]
+            return None
+
+        entries.move_to_end(key)
+        return interpretation
+
+    def set(self, key: str, interpretation: str) -> bool:
+        """Store interpretation in memory and append it to the cache file.
+
+        Args:
+            key: Key from make_key().
+            interpretation: LLM response text to cache.
+
+        Returns:
+            bool: True if write succeeded, False otherwise.
+        """
+        entries = self._load()
+        created = time.time()
+        entries[key] = (created, interpretation)
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with open(self.cache_path, "a", encoding="utf-8") as f:
+                f.write(self._dump_line(key, created, interpretation))
+
+            return True
+
+        except Exception as e:
+            print(f"⚠️  Failed to write interpretation cache: {e}")
+            return False
+
+    def _load(self) -> OrderedDict[str, tuple[float, str]]:
+        """Hydrate in-memory entries from disk on first use.
+
+        Skips corrupt and expired lines, keeps the newest max_entries, and
+        rewrites the file when it carried lines that were dropped.
+        """
+        if self._entries is not None:
+            return self._entries
+
+        entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._entries = entries
+        if not self.cache_path.exists():
+            return entries
+
+        line_count = 0
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        data = json.loads(line)
+                        key = data["key"]
+                        created = data.get("created", 0)
+                        interpretation = data["interpretation"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # Skip partial/corrupt lines
+                    if self._expired(created):
+                        entries.pop(key, None)
+                        continue
+                    entries[key] = (created, interpretation)
+                    entries.move_to_end(key)
+        except Exception as e:
+            print(f"⚠️  Failed to read interpretation cache: {e}")
+            return entries
+
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+        if line_count > len(entries):
+            self._compact(entries)
+
+        return entries
+
+    def _compact(self, entries: OrderedDict[str, tuple[float, str]]) -> None:
+        """Rewrite cache file with only live entries (atomic replace)."""
+        tmp_path = self.cache_path.with_suffix(".jsonl.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for key, (created, interpretation) in entries.items():
+                    f.write(self._dump_line(key, created, interpretation))
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            print(f"⚠️  Failed to compact interpretation cache: {e}")
+
+    def _expired(self, created: float) -> bool:
+        """True if an entry created at this timestamp is past its TTL."""
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    @staticmethod
+    def _dump_line(key: str, created: float, interpretation: str) -> str:
+        """Serialize one cache entry as a JSONL line."""
+        entry = {"key": key, "created": created, "interpretation": interpretation}
+        return json.dumps(entry) + "\n"
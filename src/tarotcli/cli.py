@@ -27,17 +27,96 @@ Example:
     $ tarotcli config-info
 """
 
+import functools
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from pydantic import TypeAdapter
 from tarotcli.config import get_config
 from tarotcli.deck import TarotDeck, lookup_card
 from tarotcli.spreads import get_spread
-from tarotcli.models import FocusArea
-from tarotcli.ai import interpret_reading_sync
-from tarotcli.ui import gather_reading_inputs, display_reading, console
-from tarotcli.persistence import ReadingPersistence
-import questionary
+from tarotcli.models import FocusArea, Reading
+from tarotcli.ui import (
+    gather_reading_inputs,
+    display_reading,
+    display_readings,
+    console,
+)
+
+if TYPE_CHECKING:
+    from tarotcli.persistence import ReadingPersistence
+
+# tarotcli.ai, tarotcli.persistence and questionary are imported inside the
+# commands that use them so trivial subcommands (version, list-spreads) start fast.
+
+
+@functools.lru_cache(maxsize=1)
+def _persistence() -> "ReadingPersistence":
+    """Create the reading store once per process.
+
+    Reused across commands in an interactive session, so path resolution
+    and the history directory check happen once rather than per reading.
+    """
+    from tarotcli.persistence import ReadingPersistence
+
+    return ReadingPersistence()
+
+
+@functools.lru_cache(maxsize=1)
+def _readings_adapter() -> TypeAdapter[list[Reading]]:
+    """Build the list[Reading] serializer on first use (history --json)."""
+    return TypeAdapter(list[Reading])
+
+
+def _stream_interpretation(reading: Reading, provider: Optional[str]) -> str:
+    """Show the AI interpretation live as it streams and return the full text.
+
+    Chunks render in a transient Live region, so display_reading() still
+    prints the final formatted reading afterwards. If the provider call
+    fails before any text arrives, falls back to the blocking
+    interpret_reading_sync() path (which has its own retries and static
+    fallback). If it fails mid-stream, the text already shown is kept
+    rather than paying for a second full request. Other exceptions are
+    bugs and propagate.
+    """
+    from rich.live import Live
+    from rich.text import Text
+    from tarotcli.ai import (
+        interpret_reading_stream_sync,
+        interpret_reading_sync,
+        provider_errors,
+    )
+
+    text = Text()
+    try:
+        with Live(
+            Text("🔮 Reading the cards...", style="bold #AF00FF"),
+            console=console,
+            transient=True,
+        ) as live:
+            for chunk in interpret_reading_stream_sync(reading, provider=provider):
+                text.append(chunk)
+                live.update(text)
+    except provider_errors() as e:
+        if text.plain:
+            print(
+                f"⚠️  AI stream interrupted ({type(e).__name__}), "
+                "keeping the partial interpretation"
+            )
+            return text.plain
+        print(
+            f"⚠️  AI streaming failed ({type(e).__name__}), retrying without streaming"
+        )
+    else:
+        # Completed stream with no content, like an empty blocking response
+        return text.plain or reading.static_interpretation
+
+    with console.status(
+        "[bold #AF00FF]🔮 Reading the cards...[/bold #AF00FF]",
+        spinner="moon",
+    ):
+        return interpret_reading_sync(reading, provider=provider)
+
 
 app = typer.Typer(
     name="tarotcli", help="Minimalist tarot reading CLI with optional AI interpretation"
@@ -50,6 +129,8 @@ def main_menu(ctx: typer.Context):
     if ctx.invoked_subcommand is not None:
         return  # Subcommand will handle it
 
+    import questionary
+
     while True:
         console.print()
         console.rule("[bold magenta]🔮 TarotCLI[/bold magenta]", style="magenta")
@@ -155,9 +236,6 @@ def read(
         >>> tarotcli read
     """
 
-    # Load deck using config system
-    deck = TarotDeck.load_default()  # Uses config.get_data_path()
-
     # Handle ctx.invoke() passing OptionInfo objects instead of None
     # This happens when called from main_menu without explicit parameters
     from typer.models import OptionInfo
@@ -177,6 +255,15 @@ def read(
     if isinstance(show_imagery, OptionInfo):
         show_imagery = False
 
+    # Start importing LiteLLM in the background so it overlaps deck loading
+    # and interactive prompts instead of delaying the first API call
+    if not no_ai:
+        from tarotcli.ai import prewarm
+
+        prewarm()
+
+    deck = TarotDeck.load_default().clone()  # Uses config.get_data_path()
+
     # Gather parameters (interactive or CLI)
     if not all([spread, focus]):
         result = gather_reading_inputs()
@@ -217,16 +304,22 @@ def read(
 
     # Add AI interpretation if requested
     if use_ai:
+        from tarotcli.ai import interpret_reading_sync
+
         try:
-            # Provider override via CLI or config default
-            with console.status(
-                "[bold #AF00FF]🔮 Reading the cards...[/bold #AF00FF]",
-                spinner="moon",
-            ):
-                reading.interpretation = interpret_reading_sync(
-                    reading,
-                    provider=provider,  # None uses config default
-                )
+            # Provider override via CLI or config default (None)
+            if console.is_terminal and not json_output:
+                # Stream to the terminal so text appears at first token
+                reading.interpretation = _stream_interpretation(reading, provider)
+            else:
+                with console.status(
+                    "[bold #AF00FF]🔮 Reading the cards...[/bold #AF00FF]",
+                    spinner="moon",
+                ):
+                    reading.interpretation = interpret_reading_sync(
+                        reading,
+                        provider=provider,  # None uses config default
+                    )
         except Exception as e:
             # Graceful degradation with helpful message
             console.print(f"[bold red]⚠️  AI interpretation failed:[/bold red] {e}")
@@ -235,11 +328,7 @@ def read(
                 "[dim]💡 Check your config.yaml or API keys if unexpected.[/dim]"
             )
 
-    # Auto-save reading if enabled
     config = get_config()
-    if config.get("output.save_readings", False):
-        persistence = ReadingPersistence()
-        persistence.save(reading)  # Gracefully fails if error occurs
 
     # Output
     if json_output:
@@ -260,6 +349,11 @@ def read(
             reading, show_static=display_static, show_imagery=display_imagery
         )
 
+    # Auto-save reading if enabled. After output, so a save warning can't
+    # land in the middle of the rendered reading or the JSON document.
+    if config.get("output.save_readings", False):
+        _persistence().save(reading)  # Gracefully fails if error occurs
+
 
 @app.command()
 def lookup(
@@ -296,8 +390,6 @@ def lookup(
             raise typer.Exit(1)
 
         # Display card meanings using Rich
-        from rich.panel import Panel
-
         console.print()
         console.rule(f"[bold #00FFFF]{card.name}[/bold #00FFFF]", style="#00FFFF")
 
@@ -310,6 +402,8 @@ def lookup(
         console.print(card.reversed_meaning)
 
         if show_imagery:
+            from rich.panel import Panel
+
             console.print()
             console.print(
                 Panel(
@@ -335,19 +429,34 @@ def history(
     json_output: bool = typer.Option(
         False, "--json", help="Output as JSON array instead of markdown"
     ),
+    reinterpret: bool = typer.Option(
+        False,
+        "--reinterpret",
+        help="Generate fresh AI interpretations for the shown readings",
+    ),
+    provider: Optional[str] = typer.Option(
+        None, "--provider", help="AI provider for --reinterpret (default: config)"
+    ),
 ):
     """View reading history.
 
     Displays past readings from JSONL storage. Requires output.save_readings
     to be enabled in config.yaml.
 
+    With --reinterpret, all shown readings are re-interpreted concurrently
+    (bounded by ai.max_concurrency) before display. Stored history is not
+    modified.
+
     Args:
         last: Number of recent readings to show. Default 10.
         json_output: Output as JSON array instead of markdown.
+        reinterpret: Re-run AI interpretation for each reading.
+        provider: AI provider override for --reinterpret.
 
     Example:
         tarotcli history --last 5
         tarotcli history --json
+        tarotcli history --last 3 --reinterpret
     """
     config = get_config()
 
@@ -361,7 +470,7 @@ def history(
         raise typer.Exit(1)
 
     # Load readings
-    persistence = ReadingPersistence()
+    persistence = _persistence()
     readings = persistence.load_last(last)
 
     if not readings:
@@ -369,33 +478,30 @@ def history(
         typer.echo("💡 Perform readings with save_readings enabled to build history.\n")
         return
 
+    if reinterpret:
+        from tarotcli.ai import interpret_many_sync
+
+        with console.status(
+            "[bold #AF00FF]🔮 Re-reading the cards...[/bold #AF00FF]",
+            spinner="moon",
+        ):
+            interpretations = interpret_many_sync(readings, provider=provider)
+        for reading, interpretation in zip(readings, interpretations):
+            reading.interpretation = interpretation
+
     # Output
     if json_output:
-        # Export as JSON array
-        import json
-
-        json_data = [r.model_dump() for r in readings]
-        print(json.dumps(json_data, indent=2, default=str))
+        # Export as JSON array (serialized by pydantic-core in one pass)
+        print(_readings_adapter().dump_json(readings, indent=2).decode())
     else:
-        # Display each reading using Rich formatting
+        # Display all readings using Rich formatting (one buffered write)
         # Get display preferences from config
         display_static = config.get("display.show_static", True)
         display_imagery = config.get("display.show_imagery", False)
 
-        console.print(f"\n[bold]📚 Showing last {len(readings)} reading(s):[/bold]\n")
-        for i, reading in enumerate(readings, start=1):
-            # timestamp is ISO string from JSONL, not datetime object
-            timestamp_str = (
-                reading.timestamp[:16].replace("T", " ")
-                if reading.timestamp
-                else "Unknown"
-            )
-            console.print(f"[dim]Reading {i} - {timestamp_str}[/dim]")
-            display_reading(
-                reading, show_static=display_static, show_imagery=display_imagery
-            )
-            if i < len(readings):
-                console.print()
+        display_readings(
+            readings, show_static=display_static, show_imagery=display_imagery
+        )
 
 
 @app.command()
@@ -434,17 +540,17 @@ def clear_history(
         )
         raise typer.Exit(0)
 
-    persistence = ReadingPersistence()
-    readings = persistence.load_all()
+    persistence = _persistence()
+    total = persistence.count()  # No parsing needed just to confirm
 
-    if not readings:
+    if not total:
         typer.echo("📭 No readings found in history. Nothing to delete.\n")
         return
 
     # Determine deletion scope
     if all:
         # Delete all readings
-        typer.echo(f"\n⚠️  You are about to delete ALL {len(readings)} reading(s).\n")
+        typer.echo(f"\n⚠️  You are about to delete ALL {total} reading(s).\n")
         confirm = typer.confirm(
             "This action cannot be undone. Continue?", default=False
         )
@@ -455,7 +561,7 @@ def clear_history(
 
         success = persistence.clear_all()
         if success:
-            typer.echo(f"✅ Deleted all {len(readings)} reading(s).\n")
+            typer.echo(f"✅ Deleted all {total} reading(s).\n")
         else:
             typer.echo("❌ Failed to delete readings. Check error messages above.\n")
             raise typer.Exit(1)
@@ -466,7 +572,7 @@ def clear_history(
             typer.echo("❌ Error: --last must be a positive number.\n", err=True)
             raise typer.Exit(1)
 
-        actual_delete = min(last, len(readings))
+        actual_delete = min(last, total)
         typer.echo(
             f"\n⚠️  You are about to delete the last {actual_delete} reading(s).\n"
         )
@@ -9,16 +9,98 @@ Environment variables use TAROTCLI_ prefix and override all file-based config.
 Secrets (API keys) are ONLY stored in environment variables, never in config files.
 """
 
+import functools
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional, cast
 
 import yaml
-from dotenv import load_dotenv
-from platformdirs import user_data_dir, user_config_dir
+from platformdirs import user_cache_dir, user_data_dir, user_config_dir
 
-# Load .env file if present (for development workflow)
-load_dotenv()
+# Load .env file if present (for development workflow). python-dotenv is only
+# imported when the project root has a .env (or TAROTCLI_USE_DOTENV=1), so
+# installed-CLI startup skips its import and search. The working directory is
+# never consulted, so running tarotcli inside another project doesn't pick up
+# that project's keys.
+_dotenv_path = Path(__file__).parent.parent.parent / ".env"
+_has_project_dotenv = _dotenv_path.exists()
+if _has_project_dotenv or os.environ.get("TAROTCLI_USE_DOTENV") == "1":
+    from dotenv import load_dotenv
+
+    # Without a project-root file, python-dotenv searches upward from this
+    # module as load_dotenv() always did
+    load_dotenv(_dotenv_path if _has_project_dotenv else None)
+
+# libyaml-backed loader when PyYAML was built with it (standard wheels are);
+# same safe subset as yaml.safe_load, parsed in C
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - pure-Python PyYAML build
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Parsed YAML keyed by path, validated against (st_mtime_ns, st_size)
+_YAML_CACHE: OrderedDict[Path, tuple[int, int, Any]] = OrderedDict()
+_YAML_CACHE_MAX = 16
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Config instances created in one process (reload_config(), tests,
+    embedding) share parses instead of re-reading default.yaml and
+    config.yaml each time. An edited file has a new mtime or size and is
+    parsed again.
+
+    The returned object is shared between callers and must be treated as
+    read-only; Config only reads and shallow-copies it while merging.
+
+    Args:
+        path: YAML file to load.
+
+    Returns:
+        Parsed YAML document (None for an empty file).
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = path.stat()
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        _YAML_CACHE.move_to_end(path)
+        return cached[2]
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    _YAML_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+    _YAML_CACHE.move_to_end(path)
+    while len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return data
+
+
+# Boolean spellings accepted in TAROTCLI_* variables (matched lowercase)
+_ENV_BOOLS = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "on": True,
+    "false": False,
+    "no": False,
+    "0": False,
+    "off": False,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _env_var_name(key_path: str) -> str:
+    """Map a dot-notation key to its override variable, e.g. TAROTCLI_AI_CACHE_DIR.
+
+    Cached because get() is called with the same handful of keys throughout
+    a reading.
+    """
+    return f"TAROTCLI_{key_path.upper().replace('.', '_')}"
 
 
 class Config:
@@ -50,6 +132,7 @@ class Config:
         self._system_config = self._load_system_defaults()
         self._user_config = self._load_user_config()
         self._merged_config = self._merge_configs()
+        self._flat_config = self._flatten_config(self._merged_config)
 
     def _load_system_defaults(self) -> dict:
         """Load bundled default configuration.
@@ -67,8 +150,7 @@ class Config:
         config_dir = Path(__file__).parent
         default_path = config_dir / "default.yaml"
 
-        with open(default_path, "r") as f:
-            return yaml.safe_load(f)
+        return _load_yaml_cached(default_path)
 
     def _load_user_config(self) -> dict:
         """Load user configuration from multiple locations.
@@ -105,15 +187,14 @@ class Config:
 
         for config_path in user_config_paths:
             if config_path.exists():
-                with open(config_path, "r") as f:
-                    return yaml.safe_load(f) or {}
+                return _load_yaml_cached(config_path) or {}
 
         return {}
 
     def _merge_configs(self) -> dict:
         """Deep merge user config over system defaults.
 
-        Uses recursive merging to allow partial overrides. For example, a user
+        Merges nested dicts to allow partial overrides. For example, a user
         can override just "models.providers.claude.temperature" without having
         to redefine the entire "models" section.
 
@@ -125,22 +206,50 @@ class Config:
         Returns:
             dict: Merged configuration with user overrides applied.
         """
-
-        def deep_merge(base: dict, override: dict) -> dict:
-            """Recursively merge override into base, preserving nested structure."""
-            result = base.copy()
-            for key, value in override.items():
-                if (
-                    key in result
-                    and isinstance(result[key], dict)
-                    and isinstance(value, dict)
-                ):
-                    result[key] = deep_merge(result[key], value)
+        result = {**self._system_config}
+
+        # Walk override branches with an explicit stack; only dicts on a path
+        # the user overrides are copied, untouched subtrees stay shared
+        stack = [(result, self._user_config)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    dst[key] = {**current}
+                    stack.append((dst[key], value))
                 else:
-                    result[key] = value
-            return result
+                    dst[key] = value
+
+        return result
 
-        return deep_merge(self._system_config, self._user_config)
+    @staticmethod
+    def _flatten_config(config: dict) -> dict[str, Any]:
+        """Index every nested key of the merged config by its dot-notation path.
+
+        Intermediate sections are indexed too, so "models.providers.claude"
+        maps to the provider dict and "models.providers.claude.model" to
+        its leaf. get() then resolves a path with one dict lookup instead
+        of splitting and walking the tree on every call.
+
+        Args:
+            config: Merged configuration dict.
+
+        Returns:
+            dict: Mapping of dot-notation path to config value.
+        """
+        flat: dict[str, Any] = {}
+        stack: list[tuple[str, dict]] = [("", config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                if not isinstance(key, str):
+                    continue  # Unreachable via dot-notation strings
+                path = prefix + key
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((path + ".", value))
+        return flat
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value with environment variable override.
@@ -176,22 +285,12 @@ class Config:
             0.7  # Returns float, not string "0.7"
         """
         # Check environment variable first (highest priority)
-        env_key = f"TAROTCLI_{key_path.upper().replace('.', '_')}"
-        env_value = os.getenv(env_key)
+        env_value = os.environ.get(_env_var_name(key_path))
         if env_value is not None:
             return self._parse_env_value(env_value)
 
-        # Navigate nested config using dot notation
-        keys = key_path.split(".")
-        value = self._merged_config
-
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-
-        return value
+        # Dot-notation paths resolved once at init (see _flatten_config)
+        return self._flat_config.get(key_path, default)
 
     def _parse_env_value(self, value: str) -> Any:
         """Parse environment variable string to appropriate type.
@@ -212,21 +311,21 @@ class Config:
             - Integer: "2000" → 2000
             - Fallback: Unchanged string
         """
-        # Handle booleans
-        if value.lower() in ("true", "yes", "1", "on"):
-            return True
-        if value.lower() in ("false", "no", "0", "off"):
-            return False
+        text = value.strip()
 
-        # Try numeric conversion
+        # Handle booleans (one lowercase + dict lookup)
+        flag = _ENV_BOOLS.get(text.lower())
+        if flag is not None:
+            return flag
+
+        # Fast path for plain digits; int()/float() still handle the rest
+        # (signs, digit underscores) before falling back to the string
+        if text.isdecimal():
+            return int(text)
         try:
-            if "." in value:
-                return float(value)
-            return int(value)
+            return float(text) if "." in text else int(text)
         except ValueError:
-            pass
-
-        return value
+            return value
 
     def get_model_config(self, provider: Optional[str] = None) -> dict:
         """Get complete model configuration for specified provider.
@@ -397,9 +496,34 @@ class Config:
         data_dir = user_data_dir("tarotcli", appauthor=False)
         return Path(data_dir) / "readings.jsonl"
 
+    def get_cache_path(self) -> Path:
+        """Get absolute path to AI interpretation cache file.
+
+        Resolution order:
+        1. Environment variable: TAROTCLI_CACHE_DIR (highest priority)
+        2. Config file: ai.cache_dir (if not null)
+        3. Platform default: Uses platformdirs user cache directory
+           - Linux: ~/.cache/tarotcli/interpretations.jsonl
+           - macOS: ~/Library/Caches/tarotcli/interpretations.jsonl
+           - Windows: C:\\Users\\<user>\\AppData\\Local\\tarotcli\\Cache\\interpretations.jsonl
+
+        Returns:
+            Path: Absolute path to interpretations.jsonl file.
+        """
+        env_dir = os.getenv("TAROTCLI_CACHE_DIR")
+        if env_dir:
+            return Path(env_dir) / "interpretations.jsonl"
+
+        config_dir = self.get("ai.cache_dir")
+        if config_dir is not None:
+            return Path(config_dir) / "interpretations.jsonl"
+
+        cache_dir = user_cache_dir("tarotcli", appauthor=False)
+        return Path(cache_dir) / "interpretations.jsonl"
 
-# Singleton pattern for global config instance
-_config = None
+
+# Singleton global config instance, created on first get_config() call
+_config: Optional[Config] = None
 
 
 def get_config() -> Config:
@@ -407,7 +531,9 @@ def get_config() -> Config:
 
     Use this function rather than instantiating Config() directly. The singleton
     pattern ensures config files are only loaded once per process, improving
-    performance and consistency.
+    performance and consistency. Files are read on the first call, not at
+    import, so a broken config.yaml can't stop the module (and commands like
+    config-info) from loading, and tests can patch the environment first.
 
     When to use vs direct instantiation:
         - Application code: ALWAYS use get_config() (standard pattern)
@@ -415,7 +541,9 @@ def get_config() -> Config:
         - Library users: Use get_config() (standard pattern)
 
     Thread safety: Not thread-safe. Config should be initialized at application
-    startup before spawning threads/processes.
+    startup before spawning threads/processes. reload_config() is not
+    synchronized either and should only be called when no other threads are
+    reading config.
 
     Returns:
         Config: Global configuration manager instance.
@@ -429,3 +557,23 @@ def get_config() -> Config:
     if _config is None:
         _config = Config()
     return _config
+
+
+def reload_config() -> Config:
+    """Discard the global configuration instance and load a fresh one.
+
+    Re-reads default.yaml and user config files (files whose mtime and size
+    are unchanged reuse their previous parse). Anything memoized against
+    the previous instance (e.g. the AI response cache) is invalidated
+    because it is keyed by config instance.
+
+    Returns:
+        Config: New global configuration manager instance.
+
+    Example:
+        >>> from tarotcli.config import reload_config
+        >>> config = reload_config()  # After editing config.yaml
+    """
+    global _config
+    _config = Config()
+    return _config
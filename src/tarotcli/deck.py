@@ -27,13 +27,74 @@ Example:
     >>> print(f"{card.name}: {card.upright_meaning}")
 """
 
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import List
-import json
+from typing import List, NoReturn, Optional
 import random
+import re
+
+from pydantic import TypeAdapter, ValidationError
 from tarotcli.models import Card, DrawnCard
 from tarotcli.config import get_config
 
+_MASK64 = (1 << 64) - 1
+
+# Validates the whole deck file, wrapped as one JSON array, into Cards
+_CARD_LIST_ADAPTER = TypeAdapter(list[Card])
+
+# Common abbreviations/aliases accepted by lookup_card(), as whole words
+_ALIASES = {
+    "pents": "pentacles",
+    "coins": "pentacles",
+}
+_ALIAS_RE = re.compile(r"\b(" + "|".join(map(re.escape, _ALIASES)) + r")\b")
+
+
+def _expand_alias(match: re.Match[str]) -> str:
+    """Replacement callback for _ALIAS_RE."""
+    return _ALIASES[match.group(1)]
+
+
+def _batched_shuffle(items: list) -> None:
+    """Shuffle list in place, drawing two swap indices per 64-bit random word.
+
+    Fisher-Yates with Lemire's batched bounded random integers (Brackett-Rozinsky
+    & Lemire, "Batched Ranged Random Integer Generation"): one getrandbits(64)
+    yields indices for positions i and i-1 via two multiply-shift steps, with
+    rejection only when the low bits fall below 2**64 mod (i+1)*i. Uniform over
+    all permutations and halves RNG calls versus random.shuffle().
+
+    Uses the module-level random generator, so random.seed() keeps shuffles
+    reproducible.
+
+    Args:
+        items: List to permute in place.
+    """
+    getrandbits = random.getrandbits
+    mask = _MASK64
+    i = len(items) - 1
+    while i > 1:
+        bound = (i + 1) * i
+        m = getrandbits(64) * (i + 1)
+        r1 = m >> 64
+        m = (m & mask) * i
+        low = m & mask
+        if low < bound:
+            threshold = (1 << 64) % bound
+            while low < threshold:
+                m = getrandbits(64) * (i + 1)
+                r1 = m >> 64
+                m = (m & mask) * i
+                low = m & mask
+        r2 = m >> 64
+        items[i], items[r1] = items[r1], items[i]
+        items[i - 1], items[r2] = items[r2], items[i - 1]
+        i -= 2
+    if i == 1:
+        j = getrandbits(1)
+        items[1], items[j] = items[j], items[1]
+
 
 class TarotDeck:
     """
@@ -44,7 +105,7 @@ class TarotDeck:
     cards in current shuffle.
 
     Attributes:
-        cards (List[Card]): Complete 78-card deck
+        cards (tuple[Card, ...]): Complete 78-card deck (immutable)
         remaining (List[Card]): Cards not yet drawn in current shuffle
 
     Example:
@@ -71,6 +132,10 @@ class TarotDeck:
             - Users can override via TAROTCLI_DATA_DIR environment variable
             - Cleaner API: TarotDeck.load_default() vs TarotDeck(Path(...))
 
+        Memoized per data path: repeat calls return a fresh clone of the
+        deck built on the first call, and the file is re-read only if its
+        mtime or size changes.
+
         Returns:
             TarotDeck: Initialized deck ready for shuffling and drawing.
 
@@ -85,7 +150,15 @@ class TarotDeck:
         """
         config = get_config()
         deck_path = config.get_data_path("tarot_cards_RW.jsonl")
-        return cls(deck_path)
+
+        # Reuse the deck built for this path while the file is unchanged;
+        # callers get a clone so shuffling never touches the cached deck
+        version = _file_version(deck_path)
+        cached = _default_decks.get(deck_path)
+        if cached is None or cached[0] != version or type(cached[1]) is not cls:
+            cached = (version, cls(deck_path))
+            _default_decks[deck_path] = cached
+        return cached[1].clone()
 
     def __init__(self, data_path: Path):
         """
@@ -102,24 +175,12 @@ class TarotDeck:
             Each line in JSONL must be valid JSON matching Card schema.
             File should contain exactly 78 cards (22 major + 56 minor).
         """
-        if not data_path.exists():
-            raise FileNotFoundError(f"Card data not found at {data_path}")
-
-        self.cards: List[Card] = []
-        with open(data_path, "r") as f:
-            for line_num, line in enumerate(f, 1):
-                try:
-                    card_data = json.loads(line)
-                    card = Card(**card_data)
-                    self.cards.append(card)
-                except json.JSONDecodeError as e:
-                    raise ValueError(f"Invalid JSON at line {line_num}: {e}") from e
-
-        if len(self.cards) != 78:
-            raise ValueError(f"Expected 78 cards, found {len(self.cards)}")
-
-        self.cards.sort(key=lambda c: c.value_int)
-        self.remaining = self.cards.copy()
+        source = (data_path.resolve(), *_file_version(data_path))
+        # The parsed tuple is shared, never copied: it can't be mutated
+        self.cards: tuple[Card, ...] = _load_cards(source)
+        self.remaining = list(self.cards)
+        # Lowercased names and exact-name map for lookup_card (read-only)
+        self._names_lower, self._name_exact = _name_tables(source)
 
     def shuffle(self, seed: int | None = None) -> None:
         """
@@ -149,8 +210,8 @@ class TarotDeck:
         if seed is not None:
             random.seed(seed)
 
-        self.remaining = self.cards.copy()
-        random.shuffle(self.remaining)
+        self.remaining = list(self.cards)
+        _batched_shuffle(self.remaining)
 
     def draw(self, count: int) -> List[DrawnCard]:
         """
@@ -186,16 +247,44 @@ class TarotDeck:
                 f"Cannot draw {count} cards, only {len(self.remaining)} remaining"
             )
 
+        # Take the top `count` cards in one slice; a single del shifts the
+        # rest once instead of pop(0) shifting the list for every card
+        top = self.remaining[:count]
+        del self.remaining[:count]
+
+        # One random bit per card for orientation, drawn in a single call
+        bits = random.getrandbits(count)
+
         drawn = []
-        for i in range(count):
-            card = self.remaining.pop(0)
-            is_reversed = random.choice([True, False])
+        for i, card in enumerate(top):
+            is_reversed = bool(bits & 1)
+            bits >>= 1
 
             drawn_card = DrawnCard(card=card, reversed=is_reversed, position=i)
             drawn.append(drawn_card)
 
         return drawn
 
+    def clone(self) -> "TarotDeck":
+        """
+        Return an independent deck sharing this deck's parsed cards.
+
+        Skips file access and validation entirely. The clone starts in
+        original sorted order with its own shuffle/draw state, so it can be
+        shuffled without affecting this deck.
+
+        Example:
+            >>> template = TarotDeck.load_default()
+            >>> deck = template.clone()
+            >>> deck.shuffle()  # template.remaining is unchanged
+        """
+        deck = object.__new__(type(self))
+        deck.cards = self.cards
+        deck.remaining = list(deck.cards)
+        deck._names_lower = self._names_lower
+        deck._name_exact = self._name_exact
+        return deck
+
     def reset(self) -> None:
         """
         Return to full 78-card deck in original sorted order (by value_int).
@@ -206,7 +295,103 @@ class TarotDeck:
         Physical analogy: Putting cards back in original box order
         (sorted by suit and value).
         """
-        self.remaining = self.cards.copy()
+        self.remaining = list(self.cards)
+
+
+# Deck file identity: (resolved path, st_mtime_ns, st_size)
+_DeckSource = tuple[Path, int, int]
+
+# Decks built by load_default(), keyed by data path, with the file version
+_default_decks: dict[Path, tuple[tuple[int, int], "TarotDeck"]] = {}
+
+
+def _file_version(data_path: Path) -> tuple[int, int]:
+    """Return (st_mtime_ns, st_size) for a deck file.
+
+    Raises:
+        FileNotFoundError: If data_path doesn't exist.
+    """
+    try:
+        stat = data_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Card data not found at {data_path}") from None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=8)
+def _load_cards(source: _DeckSource) -> tuple[Card, ...]:
+    """Parse and validate deck JSONL once per file version.
+
+    Memoized so every TarotDeck built from the same file (load_default() in
+    each command, test fixture, or example script) shares one parse instead
+    of re-reading and re-validating 78 cards. Keyed on mtime and size too,
+    so an edited file is parsed again. Returns an immutable tuple that
+    decks share as their cards. Failures are not cached.
+
+    Args:
+        source: Resolved deck JSONL path with its mtime and size.
+
+    Returns:
+        tuple[Card, ...]: 78 cards sorted by value_int.
+
+    Raises:
+        ValueError: If JSONL contains invalid card data or wrong card count.
+    """
+    lines = source[0].read_bytes().splitlines()
+    records = [line for line in lines if line.strip()]
+    try:
+        # Validate all lines as one JSON array in a single pydantic-core call
+        cards = _CARD_LIST_ADAPTER.validate_json(b"[" + b",".join(records) + b"]")
+    except ValidationError as e:
+        _raise_with_line_number(lines, e)
+    if len(cards) != len(records):
+        # A line held more than one JSON value; report it by line number
+        _raise_with_line_number(lines, None)
+
+    if len(cards) != 78:
+        raise ValueError(f"Expected 78 cards, found {len(cards)}")
+
+    cards.sort(key=attrgetter("value_int"))
+    return tuple(cards)
+
+
+@lru_cache(maxsize=8)
+def _name_tables(source: _DeckSource) -> tuple[tuple[str, ...], dict[str, Card]]:
+    """Lowercase card names once per deck file for lookup_card().
+
+    Returns names aligned with the sorted cards, plus a lowercase
+    name-to-card map for exact matches. Shared by every deck built from
+    the same file, so callers must not mutate them.
+    """
+    cards = _load_cards(source)
+    names_lower = tuple(card.name.lower() for card in cards)
+    return names_lower, dict(zip(names_lower, cards))
+
+
+def _raise_with_line_number(
+    lines: list[bytes], error: Optional[ValidationError]
+) -> NoReturn:
+    """Re-validate line by line to report where deck parsing failed.
+
+    Only runs after the whole-file validation has already failed, so the
+    happy path carries no per-line bookkeeping.
+
+    Raises:
+        ValueError: For malformed JSON, naming the offending line.
+        ValidationError: For valid JSON that doesn't match the Card schema.
+    """
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            Card.model_validate_json(line)
+        except ValidationError as e:
+            if any(err["type"] == "json_invalid" for err in e.errors()):
+                raise ValueError(f"Invalid JSON at line {line_num}: {e}") from e
+            raise
+    if error is not None:
+        raise error
+    raise ValueError("Invalid deck data")  # Unreachable: some line must fail
 
 
 def lookup_card(deck: TarotDeck, search_term: str) -> Card | list[Card] | None:
@@ -242,27 +427,24 @@ def lookup_card(deck: TarotDeck, search_term: str) -> Card | list[Card] | None:
         >>> if card is None:
         ...     print("Card not found")
     """
-    # Common abbreviations/aliases (longer aliases first to avoid partial replacement issues)
-    aliases = [
-        ("pents", "pentacles"),
-        ("coins", "pentacles"),
+    # Expand aliases in one pass; the pattern only matches alias words, so
+    # already-expanded names are left alone
+    search_lower = _ALIAS_RE.sub(_expand_alias, search_term.lower())
+
+    # An exact name always wins, so check the prebuilt map before scanning
+    exact = deck._name_exact.get(search_lower)
+    if exact is not None:
+        return exact
+
+    # Names were lowercased at load; scan without re-lowercasing per lookup
+    matches = [
+        card
+        for name, card in zip(deck._names_lower, deck.cards)
+        if search_lower in name
     ]
 
-    search_lower = search_term.lower()
-    # Expand aliases (only replace once, skip if already expanded)
-    for alias, full in aliases:
-        if alias in search_lower and full not in search_lower:
-            search_lower = search_lower.replace(alias, full)
-
-    matches = [c for c in deck.cards if search_lower in c.name.lower()]
-
     if len(matches) == 0:
         return None
     elif len(matches) == 1:
         return matches[0]
-    else:
-        # Multiple matches - check for exact match first
-        exact = [c for c in matches if c.name.lower() == search_lower]
-        if exact:
-            return exact[0]
-        return matches  # Return all matches for ambiguous case
+    return matches  # Return all matches for ambiguous case
@@ -1,11 +1,13 @@
 """Data models for tarot cards and readings.
 
-This module defines the core Pydantic models used throughout TarotCLI:
+This module defines the core data models used throughout TarotCLI:
 - Card: Represents a single tarot card from the 78-card Rider-Waite deck
 - DrawnCard: A card as drawn in a reading, with orientation and position
 - Reading: Complete reading with cards and interpretations
 
 All models provide automatic validation, JSON serialisation, and type safety.
+DrawnCard is a slotted dataclass rather than a BaseModel; Pydantic validates
+and serialises it as part of the Reading that holds it.
 The models are designed to work directly with the tarot_cards_RW.jsonl
 dataset without requiring dataset modifications.
 
@@ -49,7 +51,8 @@ Example:
     "Skill, diplomacy, address, subtlety..."
 """
 
-from typing import Literal
+from dataclasses import dataclass
+from typing import Annotated, Literal
 from enum import Enum
 
 from pydantic import BaseModel, Field, ConfigDict
@@ -65,6 +68,12 @@ class FocusArea(str, Enum):
     GENERAL = "general"
 
 
+# Display label per focus area, e.g. FocusArea.PERSONAL_GROWTH -> "Personal Growth"
+FOCUS_PRETTY: dict[FocusArea, str] = {
+    area: area.value.replace("_", " ").title() for area in FocusArea
+}
+
+
 class Card(BaseModel):
     """Single tarot card from dataset."""
 
@@ -107,20 +116,32 @@ class Card(BaseModel):
         ),
     )
 
+    # Immutable: deck loads share one Card per id across decks, clones and
+    # loaded readings, so an in-place edit would leak into all of them
+    model_config = ConfigDict(frozen=True)
+
 
-class DrawnCard(BaseModel):
+# Slotted dataclass rather than BaseModel: one is built per card on every
+# draw, and Reading validates and serializes it like a model field. Mutable
+# because the spread layout assigns position_meaning after drawing.
+@dataclass(slots=True, kw_only=True)
+class DrawnCard:
     """Card as drawn with orientation and position in spread."""
 
-    card: Card = Field(..., description="The card object from deck")
-    reversed: bool = Field(..., description="True if drawn reversed, False if upright")
-    position: int = Field(..., description="Position in spread (0-indexed)")
-    position_meaning: str = Field(
-        default="",
-        description=(
-            "Position significance in spread (e.g. 'Past', 'Present', 'Future'). "
-            "Assigned by spread layout during reading creation."
+    card: Annotated[Card, Field(description="The card object from deck")]
+    reversed: Annotated[
+        bool, Field(description="True if drawn reversed, False if upright")
+    ]
+    position: Annotated[int, Field(description="Position in spread (0-indexed)")]
+    position_meaning: Annotated[
+        str,
+        Field(
+            description=(
+                "Position significance in spread (e.g. 'Past', 'Present', 'Future'). "
+                "Assigned by spread layout during reading creation."
+            )
         ),
-    )
+    ] = ""
 
     @property
     def effective_meaning(self) -> str:
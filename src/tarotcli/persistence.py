@@ -9,12 +9,15 @@ Design principles:
 - User control: Opt-in via config (default: disabled)
 """
 
-import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from tarotcli.config import get_config
-from tarotcli.models import Reading
+from tarotcli.models import Card, Reading
+
+# Initial read size when scanning back from the end of the file in load_last()
+_TAIL_BLOCK_SIZE = 64 * 1024
 
 
 class ReadingPersistence:
@@ -37,6 +40,11 @@ class ReadingPersistence:
         >>> persistence.save(reading)  # Auto-creates directory if needed
         >>> readings = persistence.load_all()  # Returns list of Reading objects
         >>> recent = persistence.load_last(5)  # Last 5 readings
+
+        >>> # Bulk saves share one open append handle
+        >>> with ReadingPersistence() as persistence:
+        ...     for reading in imported:
+        ...         persistence.save(reading)
     """
 
     def __init__(self, config_override: Optional[Path] = None):
@@ -50,6 +58,52 @@ class ReadingPersistence:
         self.readings_path = (
             config_override if config_override else config.get_readings_path()
         )
+        self._parent_ready = False  # Skip mkdir on later saves once created
+        self._handle: Optional[BinaryIO] = None  # Open while used as a context
+
+    def __enter__(self) -> "ReadingPersistence":
+        """Open the history file once for a run of saves.
+
+        Saves inside the with-block append through this handle instead of
+        opening and closing the file per reading. If it can't be opened,
+        saves fall back to opening the file themselves.
+        """
+        try:
+            self.readings_path.parent.mkdir(parents=True, exist_ok=True)
+            self._parent_ready = True
+            self._handle = open(self.readings_path, "ab")
+        except Exception as e:
+            print(f"⚠️  Failed to open reading history: {e}")
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Sync and close the handle opened by __enter__."""
+        self.flush()
+        self._close_handle()
+
+    def flush(self) -> bool:
+        """Force readings saved through the open handle to disk.
+
+        Each save already flushes its lines to the OS, so other readers see
+        them; this only adds an fsync checkpoint. No-op outside a with-block.
+
+        Returns:
+            bool: True if synced (or nothing to sync), False on error.
+        """
+        if self._handle is None:
+            return True
+        try:
+            os.fsync(self._handle.fileno())
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to sync reading history: {e}")
+            return False
+
+    def _close_handle(self) -> None:
+        """Close the held append handle, if any."""
+        if self._handle is not None:
+            handle, self._handle = self._handle, None
+            handle.close()
 
     def save(self, reading: Reading) -> bool:
         """Save reading to JSONL file (append-only).
@@ -68,20 +122,57 @@ class ReadingPersistence:
             >>> persistence = ReadingPersistence()
             >>> success = persistence.save(reading)
         """
-        try:
-            # Ensure parent directory exists
-            self.readings_path.parent.mkdir(parents=True, exist_ok=True)
+        return self.save_many([reading]) == 1
 
-            # Append reading as single JSON line
-            with open(self.readings_path, "a", encoding="utf-8") as f:
-                f.write(reading.model_dump_json() + "\n")
+    def save_many(self, readings: list[Reading]) -> int:
+        """Append several readings to the JSONL file in a single write.
 
-            return True
+        Opens the file once and writes all lines as one buffer, so bulk
+        imports don't pay an open/close per reading. Same graceful error
+        handling as save().
+
+        Args:
+            readings: Readings to persist, in order.
+
+        Returns:
+            int: Number of readings written (0 on failure).
+
+        Example:
+            >>> persistence = ReadingPersistence()
+            >>> persistence.save_many(imported_readings)
+        """
+        if not readings:
+            return 0
+
+        try:
+            # Ensure parent directory exists (once per instance)
+            if not self._parent_ready:
+                self.readings_path.parent.mkdir(parents=True, exist_ok=True)
+                self._parent_ready = True
+
+            # Append readings as JSON lines in one write. None fields are
+            # omitted and load back as defaults
+            buffer = "".join(
+                reading.model_dump_json(exclude_none=True) + "\n"
+                for reading in readings
+            ).encode()
+
+            # Buffered writes retry short OS writes until the whole buffer
+            # is out; flush() hands it to the OS before save returns
+            if self._handle is not None:
+                self._handle.write(buffer)
+                self._handle.flush()
+            else:
+                with open(self.readings_path, "ab") as f:
+                    f.write(buffer)
+
+            return len(readings)
 
         except Exception as e:
             # Graceful degradation: warn but don't block reading
+            self._parent_ready = False  # Directory may be gone; recheck next time
             print(f"⚠️  Failed to save reading: {e}")
-            return False
+            return 0
 
     def load_all(self) -> list[Reading]:
         """Load all readings from JSONL file.
@@ -103,31 +194,31 @@ class ReadingPersistence:
         readings = []
         try:
             with open(self.readings_path, "r", encoding="utf-8") as f:
+                # Plain buffered line scan, not mmap: delete_last() truncates
+                # in place, and a concurrent truncate under a mapping would
+                # SIGBUS the process instead of raising
                 for line_num, line in enumerate(f, start=1):
                     line = line.strip()
                     if not line:
                         continue  # Skip empty lines
 
-                    try:
-                        data = json.loads(line)
-                        reading = Reading.model_validate(data)
+                    reading = self._parse_line(line, line_num)
+                    if reading is not None:
                         readings.append(reading)
-                    except (json.JSONDecodeError, ValueError) as e:
-                        # Skip malformed lines, warn user
-                        print(f"⚠️  Skipping invalid reading at line {line_num}: {e}")
-                        continue
 
         except Exception as e:
             print(f"⚠️  Error loading readings: {e}")
             return []
 
-        return readings
+        return _intern_cards(readings)
 
     def load_last(self, n: int = 10) -> list[Reading]:
         """Load last N readings from file.
 
-        More efficient than load_all() for large files - only deserializes
-        the requested number of readings.
+        More efficient than load_all() for large files - reads backwards from
+        the end of the file in blocks (doubling each time) until N non-empty
+        lines are found, then deserializes just those. Malformed lines among
+        the last N are skipped, so fewer than N readings may be returned.
 
         Args:
             n: Number of recent readings to load. Default 10.
@@ -141,8 +232,66 @@ class ReadingPersistence:
             >>> for reading in recent:
             ...     print(f"{reading.timestamp}: {reading.spread_type}")
         """
-        all_readings = self.load_all()
-        return all_readings[-n:] if all_readings else []
+        if n <= 0 or not self.readings_path.exists():
+            return []
+
+        try:
+            with open(self.readings_path, "rb") as f:
+                readings = []
+                for offset, line in _read_tail(f, n):
+                    try:
+                        readings.append(Reading.model_validate_json(line))
+                    except ValueError as e:
+                        # Only a bad line needs the newlines before it counted
+                        f.seek(0)
+                        self._warn_skipped(f.read(offset).count(b"\n") + 1, e)
+        except Exception as e:
+            print(f"⚠️  Error loading readings: {e}")
+            return []
+
+        return _intern_cards(readings)
+
+    def count(self) -> int:
+        """Count stored readings without deserializing them.
+
+        Counts non-empty lines, so malformed lines are included - cheap
+        enough for confirmation prompts over large histories.
+
+        Returns:
+            int: Number of stored lines, or 0 if file missing/unreadable.
+
+        Example:
+            >>> persistence = ReadingPersistence()
+            >>> print(f"{persistence.count()} readings stored")
+        """
+        if not self.readings_path.exists():
+            return 0
+
+        try:
+            with open(self.readings_path, "rb") as f:
+                return sum(1 for line in f if not line.isspace())
+        except Exception as e:
+            print(f"⚠️  Error loading readings: {e}")
+            return 0
+
+    @staticmethod
+    def _parse_line(line: str, line_num: int) -> Optional[Reading]:
+        """Parse one JSONL line, warning and returning None if malformed.
+
+        Parses and validates in one pydantic-core pass; a JSON syntax error
+        surfaces as a ValidationError like any schema mismatch.
+        """
+        try:
+            return Reading.model_validate_json(line)
+        except ValueError as e:
+            # Skip malformed lines, warn user
+            ReadingPersistence._warn_skipped(line_num, e)
+            return None
+
+    @staticmethod
+    def _warn_skipped(line_num: int, error: ValueError) -> None:
+        """Warn that a malformed line was skipped."""
+        print(f"⚠️  Skipping invalid reading at line {line_num}: {error}")
 
     def delete_last(self, n: int) -> bool:
         """Delete last N readings from storage.
@@ -151,6 +300,10 @@ class ReadingPersistence:
         preserving older history. Useful for privacy when you want to remove
         recent sensitive readings without losing entire history.
 
+        Scans back from the end of the file for the start of the Nth
+        non-empty line and truncates there - no parsing, no rewrite. Counts
+        lines like count(), so malformed lines count as readings.
+
         Args:
             n: Number of recent readings to delete.
 
@@ -161,26 +314,21 @@ class ReadingPersistence:
             >>> persistence = ReadingPersistence()
             >>> persistence.delete_last(5)  # Remove last 5 readings
         """
-        try:
-            all_readings = self.load_all()
-
-            if not all_readings:
-                # No readings to delete
-                return True
-
-            # Keep all except last N
-            readings_to_keep = all_readings[:-n] if n < len(all_readings) else []
+        if n <= 0 or not self.readings_path.exists():
+            return True
 
-            # Rewrite file with remaining readings
-            if readings_to_keep:
-                # Clear file and rewrite
-                with open(self.readings_path, "w", encoding="utf-8") as f:
-                    for reading in readings_to_keep:
-                        f.write(reading.model_dump_json() + "\n")
-            else:
-                # All readings deleted, remove file
-                if self.readings_path.exists():
-                    self.readings_path.unlink()
+        try:
+            # One extra line tells whether anything is left before the cut
+            with open(self.readings_path, "rb") as f:
+                tail = _read_tail(f, n + 1)
+
+            if len(tail) > n:
+                # Keep everything up to the first line being deleted
+                os.truncate(self.readings_path, tail[-n][0])
+            elif tail:
+                # All readings deleted, remove file (later saves reopen it)
+                self._close_handle()
+                self.readings_path.unlink()
 
             return True
 
@@ -202,8 +350,66 @@ class ReadingPersistence:
         """
         try:
             if self.readings_path.exists():
+                self._close_handle()  # Don't keep appending to the unlinked file
                 self.readings_path.unlink()
             return True
         except Exception as e:
             print(f"⚠️  Failed to clear readings: {e}")
             return False
+
+
+def _intern_cards(readings: list[Reading]) -> list[Reading]:
+    """Make equal cards across loaded readings share one Card instance.
+
+    Every saved line embeds full card data, so a long history would
+    otherwise hold one Card object per drawn card rather than per distinct
+    card. Cards are only shared when equal, so stored text that differs
+    from another reading's copy (e.g. an edited deck) is kept as-is.
+
+    Args:
+        readings: Freshly loaded readings, updated in place.
+
+    Returns:
+        list[Reading]: The same list, for chaining.
+    """
+    pool: dict[str, Card] = {}
+    for reading in readings:
+        for drawn in reading.cards:
+            card = pool.setdefault(drawn.card.id, drawn.card)
+            if card is not drawn.card and card == drawn.card:
+                drawn.card = card
+    return readings
+
+
+def _read_tail(f: BinaryIO, count: int) -> list[tuple[int, bytes]]:
+    """Return the last `count` non-empty lines of a file with their offsets.
+
+    Reads backwards from the end in blocks, doubling the block size until
+    enough lines are found or the start of the file is reached, so the
+    cost depends on the lines returned rather than on the file size.
+
+    Args:
+        f: File opened in binary mode.
+        count: Number of non-empty lines wanted.
+
+    Returns:
+        list[tuple[int, bytes]]: (byte offset of line start, line) pairs in
+        file order; fewer than `count` if the file has fewer lines.
+    """
+    end = f.seek(0, 2)
+    window = _TAIL_BLOCK_SIZE
+    while True:
+        start = max(0, end - window)
+        f.seek(start)
+        lines = f.read(end - start).split(b"\n")
+        offset = start
+        if start > 0:
+            offset += len(lines.pop(0)) + 1  # May be cut mid-line
+        tail = []
+        for line in lines:
+            if line.strip():
+                tail.append((offset, line))
+            offset += len(line) + 1
+        if len(tail) >= count or start == 0:
+            return tail[-count:]
+        window *= 2
@@ -4,13 +4,13 @@ This module defines tarot spread templates (number of cards, position meanings)
 and creates readings with static interpretation (no AI).
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
-from tarotcli.models import DrawnCard, Reading, FocusArea
+from tarotcli.models import FOCUS_PRETTY, DrawnCard, Reading, FocusArea
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SpreadLayout:
     """Template for a tarot spread defining positions and their meanings."""
 
@@ -18,6 +18,15 @@ class SpreadLayout:
     display_name: str
     positions: List[str]
     description: str
+    # Fixed pieces of the static interpretation, built once per layout
+    _header: str = field(init=False, repr=False, compare=False)
+    _position_headers: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_header", f"# {self.display_name}\n")
+        object.__setattr__(
+            self, "_position_headers", tuple(f"\n## {p}: " for p in self.positions)
+        )
 
     def card_count(self) -> int:
         """Return number of cards needed for this spread."""
@@ -78,22 +87,21 @@ class SpreadLayout:
         Foundation note: This ensures readings ALWAYS complete successfully,
         regardless of API availability. Built to degrade gracefully.
         """
-        parts = [f"# {self.display_name}"]
+        parts = [self._header]
 
         if question:
-            parts.append(f"\n**Question**: {question}")
+            parts.append(f"\n**Question**: {question}\n")
 
-        parts.append(f"**Focus**: {focus_area.value.replace('_', ' ').title()}")
-        parts.append("")
+        parts.append(f"**Focus**: {FOCUS_PRETTY[focus_area]}\n")
 
-        for card in cards:
+        for card, position_header in zip(cards, self._position_headers):
             orientation = "Reversed" if card.reversed else "Upright"
             parts.append(
-                f"## {card.position_meaning}: {card.card.name} ({orientation})\n"
+                f"{position_header}{card.card.name} ({orientation})\n"
                 f"{card.effective_meaning}"
             )
 
-        return "\n".join(parts)
+        return "".join(parts)
 
 
 # Spread definitions
@@ -12,20 +12,20 @@ Main Functions:
 - prompt_use_ai_interpretation(): Choose AI vs static interpretation
 - gather_reading_inputs(): Complete interactive flow
 - display_reading(): Formatted terminal output with Rich
+- display_readings(): History listing of several readings
 
 All interactive functions include progress indicators, help text, and
 appropriate default values for smooth user experience.
 """
 
 import sys
-import questionary
+from functools import lru_cache
 from typing import Tuple, Optional
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
+from rich.console import Console, Group, RenderableType
 from rich.theme import Theme
 from rich.align import Align
+from rich.rule import Rule
+from rich.text import Text
 
 # Mystical theme for tarot reading
 mystical_theme = Theme(
@@ -41,16 +41,49 @@ mystical_theme = Theme(
     }
 )
 from tarotcli.config import get_config
-from tarotcli.models import FocusArea, Reading
+from tarotcli.models import FOCUS_PRETTY, FocusArea, Reading
 from tarotcli.spreads import SPREADS
-from rich import box
+
+# questionary (prompt_toolkit), rich.markdown and the rich panel/table/box
+# modules are imported where they are used: non-interactive runs never prompt,
+# and commands that never display a reading don't build panels or tables.
 
 # Rich console for formatted output with custom theme
 console = Console(theme=mystical_theme)
 
 
+@lru_cache(maxsize=32)
+def _pretty(name: str) -> str:
+    """Display form of a snake_case identifier, e.g. 'three_card' -> 'Three Card'."""
+    return name.replace("_", " ").title()
+
+
+# Prompt choices, built once rather than on every interactive prompt
+_SPREAD_CHOICES = [
+    {"name": f"{spread.display_name} - {spread.description}", "value": name}
+    for name, spread in SPREADS.items()
+]
+_FOCUS_CHOICES = [{"name": FOCUS_PRETTY[focus], "value": focus} for focus in FocusArea]
+
+# Card orientation labels indexed by DrawnCard.reversed (False=0, True=1)
+_ORIENTATIONS = ("Upright", "Reversed")
+# (label, style) pairs for the table's Orientation column, and the matching
+# meaning colour, indexed the same way
+_RICH_ORIENTATIONS = (("↑ Upright", "bold green"), ("↓ Reversed", "bold red"))
+_MEANING_STYLES = ("green", "red")
+
+
+def _reading_title(reading: Reading) -> str:
+    """Heading for a reading, e.g. 'Three Card - Personal Growth'."""
+    return f"{_pretty(reading.spread_type)} - {FOCUS_PRETTY[reading.focus_area]}"
+
+
 def _is_terminal() -> bool:
-    """Check if stdout is connected to a terminal (TTY)."""
+    """Check if stdout is connected to a terminal (TTY).
+
+    Not cached: it is one syscall per display, and sys.stdout may be
+    replaced between calls (redirection, test capture).
+    """
     return sys.stdout.isatty()
 
 
@@ -72,12 +105,9 @@ def prompt_spread_selection() -> str:
         │   Single Card                          │
         └────────────────────────────────────────┘
     """
-    choices = [
-        {"name": f"{spread.display_name} - {spread.description}", "value": name}
-        for name, spread in SPREADS.items()
-    ]
+    import questionary
 
-    return questionary.select("Select spread type:", choices=choices).ask()
+    return questionary.select("Select spread type:", choices=_SPREAD_CHOICES).ask()
 
 
 def prompt_focus_area() -> FocusArea:
@@ -97,13 +127,10 @@ def prompt_focus_area() -> FocusArea:
         │   General Guidance                     │
         └────────────────────────────────────────┘
     """
-    choices = [
-        {"name": focus.value.replace("_", " ").title(), "value": focus}
-        for focus in FocusArea
-    ]
+    import questionary
 
     return questionary.select(
-        "What is the focus of this reading?", choices=choices
+        "What is the focus of this reading?", choices=_FOCUS_CHOICES
     ).ask()
 
 
@@ -118,6 +145,8 @@ def prompt_question() -> Optional[str]:
         >>> question = prompt_question()
         Specific question (press Enter to skip): Should I change jobs?
     """
+    import questionary
+
     question = questionary.text(
         "Specific question (press Enter to skip):", default=""
     ).ask()
@@ -134,6 +163,7 @@ def prompt_use_ai_interpretation() -> bool:
     Returns:
         True if user wants AI interpretation, False for static only
     """
+    import questionary
 
     config = get_config()
     provider = config.get("models.default_provider", "claude")
@@ -152,6 +182,8 @@ def prompt_show_imagery() -> bool:
     Returns:
         True to show imagery, False otherwise.
     """
+    import questionary
+
     return questionary.confirm(
         "Include Waite's imagery descriptions?", default=False
     ).ask()
@@ -166,6 +198,8 @@ def prompt_show_static() -> bool:
     Returns:
         True to show static meanings in table column, False otherwise.
     """
+    import questionary
+
     return questionary.confirm("Show card meanings in table?", default=True).ask()
 
 
@@ -212,16 +246,15 @@ def gather_reading_inputs() -> Optional[
     # Check if config has display preferences, else prompt
     config = get_config()
 
-    if config.get("display.show_imagery") is not None:
-        show_imagery = config.get("display.show_imagery", False)
-    else:
+    # One lookup per key: None means unset, so prompt instead
+    show_imagery = config.get("display.show_imagery")
+    if show_imagery is None:
         show_imagery = prompt_show_imagery()
         if show_imagery is None:
             return None  # User cancelled
 
-    if config.get("display.show_static") is not None:
-        show_static = config.get("display.show_static", True)
-    else:
+    show_static = config.get("display.show_static")
+    if show_static is None:
         show_static = prompt_show_static()
         if show_static is None:
             return None  # User cancelled
@@ -232,51 +265,67 @@ def gather_reading_inputs() -> Optional[
 def _display_reading_plain(
     reading: Reading, show_static: bool = False, show_imagery: bool = False
 ) -> None:
-    """Plain text output for file redirection (non-TTY)."""
-    title = (
-        f"{reading.spread_type.replace('_', ' ').title()} - "
-        f"{reading.focus_area.value.replace('_', ' ').title()}"
-    )
-    print(f"\n# {title}\n")
+    """Plain text output for file redirection (non-TTY), in a single write."""
+    title = _reading_title(reading)
+    lines = [f"\n# {title}\n"]
 
     if reading.question:
-        print(f"**Question:** {reading.question}\n")
+        lines.append(f"**Question:** {reading.question}\n")
 
-    print("## Cards Drawn\n")
+    lines.append("## Cards Drawn\n")
     for card in reading.cards:
-        orientation = "Reversed" if card.reversed else "Upright"
-        print(f"- **{card.position_meaning}:** {card.card.name} ({orientation})")
+        orientation = _ORIENTATIONS[card.reversed]
+        lines.append(f"- **{card.position_meaning}:** {card.card.name} ({orientation})")
 
     if show_imagery:
-        print("\n## Imagery (Waite 1911)\n")
+        lines.append("\n## Imagery (Waite 1911)\n")
         for card in reading.cards:
-            print(f"### {card.card.name}\n")
-            print(f"{card.card.description}\n")
+            lines.append(f"### {card.card.name}\n")
+            lines.append(f"{card.card.description}\n")
 
-    print("\n## Interpretation\n")
+    lines.append("\n## Interpretation\n")
     if reading.interpretation:
-        print(reading.interpretation)
+        lines.append(reading.interpretation)
         if show_static:
-            print("\n## Static Interpretation\n")
-            print(reading.static_interpretation)
+            lines.append("\n## Static Interpretation\n")
+            lines.append(reading.static_interpretation)
     else:
-        print(reading.static_interpretation)
+        lines.append(reading.static_interpretation)
+
+    lines.append("")  # Trailing newline after the last line
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def _display_reading_rich(
     reading: Reading, show_static: bool = False, show_imagery: bool = False
 ) -> None:
-    """Rich formatted output for terminal display."""
-    title = (
-        f"{reading.spread_type.replace('_', ' ').title()} - "
-        f"{reading.focus_area.value.replace('_', ' ').title()}"
-    )
-    console.print()
-    console.rule(f"[bold #AF00FF]🔮 {title} 🔮[/bold #AF00FF]", style="#AF00FF")
-    console.print()
+    """Rich formatted output for terminal display (single console.print)."""
+    console.print(Group(*_reading_renderables(reading, show_static, show_imagery)))
+
+
+def _reading_renderables(
+    reading: Reading, show_static: bool = False, show_imagery: bool = False
+) -> list[RenderableType]:
+    """Build the Rich renderables for one reading, in display order.
+
+    Returned rather than printed so callers can render one or many readings
+    in a single console.print(Group(...)) - one render pass and one write.
+    Empty Text() entries stand in for blank-line console.print() calls.
+    """
+    from rich import box
+    from rich.panel import Panel
+    from rich.table import Table
+
+    title = _reading_title(reading)
+    parts: list[RenderableType] = [
+        Text(),
+        Rule(f"[bold #AF00FF]🔮 {title} 🔮[/bold #AF00FF]", style="#AF00FF"),
+        Text(),
+    ]
 
     if reading.question:
-        console.print(
+        parts.append(
             Align.center(
                 Panel(
                     f'[italic #A8B5BF]"{reading.question}"[/italic #A8B5BF]',  # Tundra italics
@@ -288,7 +337,7 @@ def _display_reading_rich(
                 )
             )
         )
-        console.print()
+        parts.append(Text())
 
     # Cards Table
     # Add Meaning column when showing static interpretation (no AI or show_static=True)
@@ -317,37 +366,39 @@ def _display_reading_rich(
         )
 
     for card in reading.cards:
-        orientation = (
-            "[bold red]↓ Reversed[/bold red]"
-            if card.reversed
-            else "[bold green]↑ Upright[/bold green]"
-        )
+        # Styled Text cells skip markup parsing; assemble() styles just the
+        # label (not the centring padding), as the markup string used to
+        orientation = _RICH_ORIENTATIONS[card.reversed]
 
         # Build row based on which columns are enabled
-        row_data = [card.position_meaning, card.card.name, orientation]
+        row_data: list[RenderableType] = [
+            card.position_meaning,
+            card.card.name,
+            Text.assemble(orientation),
+        ]
 
         if show_meaning_column:
-            # Color-code meaning to match orientation (green for upright, red for reversed)
-            meaning_color = "red" if card.reversed else "green"
-            meaning_text = (
-                f"[{meaning_color}]{card.effective_meaning}[/{meaning_color}]"
+            # Color-code meaning to match orientation (green for upright, red for
+            # reversed)
+            row_data.append(
+                Text(card.effective_meaning, style=_MEANING_STYLES[card.reversed])
             )
-            row_data.append(meaning_text)
 
         if show_imagery:
             row_data.append(card.card.description)
 
         table.add_row(*row_data)
 
-    console.print(table, justify="center")
-    console.print()
+    parts += [Align.center(table), Text()]
 
     # Interpretation Panel
     # Only show if AI interpretation exists (meanings already in table for static mode)
     if reading.interpretation:
+        from rich.markdown import Markdown
+
         # console.rule("[bold #4682B4]Interpretation[/bold #4682B4]", style="#4682B4")
         # console.print()
-        console.print(
+        parts.append(
             Panel(
                 Markdown(reading.interpretation),
                 title="[bold #AF00FF]🔮 AI Narrative Interpretation[/bold #AF00FF]",
@@ -358,8 +409,8 @@ def _display_reading_rich(
         # Note: show_static parameter no longer shows redundant panel
         # Meanings appear in table's 4th column when show_static=True
 
-    console.print()
-    console.rule(style="#AF00FF")
+    parts += [Text(), Rule(style="#AF00FF")]
+    return parts
 
 
 def display_reading(
@@ -383,3 +434,52 @@ def display_reading(
         _display_reading_rich(reading, show_static, show_imagery)
     else:
         _display_reading_plain(reading, show_static, show_imagery)
+
+
+def display_readings(
+    readings: list[Reading], show_static: bool = False, show_imagery: bool = False
+) -> None:
+    """Display several readings (history), each headed by number and timestamp.
+
+    On a terminal, every reading is built into one Rich Group and written
+    with a single console.print(), instead of one render-and-flush per
+    element per reading. Redirected output uses the plain text format.
+
+    Args:
+        readings: Readings to display, oldest first.
+        show_static: If True, show static interpretation even when AI present.
+        show_imagery: If True, include Waite's 1911 imagery descriptions.
+
+    Returns:
+        None. Prints formatted readings to stdout.
+    """
+    header = f"\n[bold]📚 Showing last {len(readings)} reading(s):[/bold]\n"
+    terminal = _is_terminal()
+    parts: list[RenderableType] = []
+
+    if terminal:
+        parts.append(console.render_str(header))
+    else:
+        console.print(header)
+
+    for i, reading in enumerate(readings, start=1):
+        # timestamp is ISO string from JSONL, not datetime object
+        timestamp_str = (
+            reading.timestamp[:16].replace("T", " ") if reading.timestamp else "Unknown"
+        )
+        reading_header = f"[dim]Reading {i} - {timestamp_str}[/dim]"
+        last = i == len(readings)
+
+        if terminal:
+            parts.append(console.render_str(reading_header))
+            parts += _reading_renderables(reading, show_static, show_imagery)
+            if not last:
+                parts.append(Text())
+        else:
+            console.print(reading_header)
+            _display_reading_plain(reading, show_static, show_imagery)
+            if not last:
+                console.print()
+
+    if terminal:
+        console.print(Group(*parts))
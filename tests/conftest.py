@@ -57,8 +57,13 @@ def mock_config():
     """
     config = MagicMock()
 
-    # Default provider
-    config.get.return_value = "claude"
+    # Default provider (other keys fall back to the caller's default)
+    def mock_get(key_path, default=None):
+        if key_path == "models.default_provider":
+            return "claude"
+        return default
+
+    config.get.side_effect = mock_get
 
     # Model configs for different providers
     def mock_get_model_config(provider=None):
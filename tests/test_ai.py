@@ -10,9 +10,18 @@ from unittest.mock import patch, AsyncMock, MagicMock
 from tarotcli.ai import (
     interpret_reading,
     interpret_reading_sync,
+    interpret_many,
+    interpret_many_sync,
+    interpret_reading_stream,
+    interpret_reading_stream_sync,
     _build_interpretation_prompt,
+    _build_prompt_parts,
+    _cache_key,
+    _resolve_provider,
     FOCUS_CONTEXTS,
 )
+from tarotcli.cache import InterpretationCache
+from tarotcli.config import Config
 from tarotcli.models import FocusArea
 
 
@@ -39,6 +48,22 @@ async def test_interpret_reading_returns_static_without_api_key(
         assert result == sample_reading.static_interpretation
 
 
+@pytest.mark.asyncio
+async def test_missing_api_key_reported_once(sample_reading, mock_config, capsys):
+    """Missing-key notice prints once per provider, not once per reading."""
+    mock_config.get_api_key.side_effect = None
+    mock_config.get_api_key.return_value = None
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai._warned_missing_key", set()),
+    ):
+        for _ in range(3):
+            await interpret_reading(sample_reading)
+
+    assert capsys.readouterr().out.count("No API key found") == 1
+
+
 @pytest.mark.asyncio
 async def test_interpret_reading_calls_api_with_key(sample_reading, mock_config):
     """With API key present, should attempt API call."""
@@ -121,6 +146,24 @@ async def test_interpret_reading_respects_custom_timeout(sample_reading, mock_co
         assert mock_call.call_args[1]["timeout"] == 60
 
 
+@pytest.mark.asyncio
+async def test_interpret_reading_enforces_overall_deadline(sample_reading, mock_config):
+    """A backend that ignores its timeout is cut off by the wait_for deadline."""
+
+    async def hang(**kwargs):
+        await asyncio.sleep(10)
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=hang),
+    ):
+        result = await asyncio.wait_for(
+            interpret_reading(sample_reading, timeout=0.05), timeout=2
+        )
+
+    assert result == sample_reading.static_interpretation
+
+
 @pytest.mark.asyncio
 async def test_interpret_reading_respects_custom_provider(sample_reading, mock_config):
     """Custom provider parameter should be passed to API call."""
@@ -137,6 +180,449 @@ async def test_interpret_reading_respects_custom_provider(sample_reading, mock_c
         assert mock_call.call_args[1]["model"] == "gpt-4"
 
 
+@pytest.mark.asyncio
+async def test_interpret_reading_serves_repeat_prompt_from_cache(
+    sample_reading, mock_config, tmp_path
+):
+    """With ai.cache_enabled, an identical reading skips the second API call."""
+
+    def mock_get(key_path, default=None):
+        if key_path == "ai.cache_enabled":
+            return True
+        if key_path == "models.default_provider":
+            return "claude"
+        return default
+
+    mock_config.get.side_effect = mock_get
+    mock_config.get_cache_path.return_value = tmp_path / "interpretations.jsonl"
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Cached reading"))]
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", return_value=mock_response) as mock_call,
+    ):
+        first = await interpret_reading(sample_reading)
+        second = await interpret_reading(sample_reading)
+
+    assert first == second == "Cached reading"
+    assert mock_call.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_digest_reused_for_repeat_prompt(
+    sample_reading, mock_config, tmp_path
+):
+    """Repeat lookups of the same prompt reuse the key instead of re-hashing."""
+
+    def mock_get(key_path, default=None):
+        if key_path == "ai.cache_enabled":
+            return True
+        if key_path == "models.default_provider":
+            return "claude"
+        return default
+
+    mock_config.get.side_effect = mock_get
+    mock_config.get_cache_path.return_value = tmp_path / "interpretations.jsonl"
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Cached reading"))]
+
+    _cache_key.cache_clear()
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", return_value=mock_response),
+        patch(
+            "tarotcli.ai.InterpretationCache.make_key",
+            wraps=InterpretationCache.make_key,
+        ) as mock_make_key,
+    ):
+        for _ in range(3):
+            await interpret_reading(sample_reading)
+
+    assert mock_make_key.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_native_backend_used_when_configured(sample_reading, mock_config):
+    """models.backend: native dispatches to the provider SDK call, not LiteLLM."""
+
+    def mock_get(key_path, default=None):
+        if key_path == "models.backend":
+            return "native"
+        if key_path == "models.default_provider":
+            return "claude"
+        return default
+
+    mock_config.get.side_effect = mock_get
+    native_call = AsyncMock(return_value="Native interpretation")
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch.dict("tarotcli.ai._PROVIDER_BACKENDS", {"claude": ("json", native_call)}),
+        patch("tarotcli.ai.acompletion") as mock_litellm,
+    ):
+        result = await interpret_reading(sample_reading)
+
+    assert result == "Native interpretation"
+    assert native_call.called
+    assert not mock_litellm.called
+
+
+@pytest.mark.asyncio
+async def test_native_backend_falls_back_without_sdk(sample_reading, mock_config):
+    """Missing SDK module falls back to LiteLLM."""
+
+    def mock_get(key_path, default=None):
+        if key_path == "models.backend":
+            return "native"
+        if key_path == "models.default_provider":
+            return "claude"
+        return default
+
+    mock_config.get.side_effect = mock_get
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Via LiteLLM"))]
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch.dict(
+            "tarotcli.ai._PROVIDER_BACKENDS",
+            {"claude": ("tarotcli_missing_sdk", AsyncMock())},
+        ),
+        patch("tarotcli.ai.acompletion", return_value=mock_response),
+    ):
+        result = await interpret_reading(sample_reading)
+
+    assert result == "Via LiteLLM"
+
+
+def test_provider_resolution_sees_env_changes(monkeypatch):
+    """A key or default provider exported after the first reading applies."""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.delenv("TAROTCLI_MODELS_DEFAULT_PROVIDER", raising=False)
+
+    with patch("tarotcli.ai.get_config", return_value=Config()):
+        assert _resolve_provider("claude")[2] is None
+
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-late")
+        monkeypatch.setenv("TAROTCLI_MODELS_DEFAULT_PROVIDER", "ollama")
+
+        assert _resolve_provider("claude")[2] == "sk-ant-late"
+        assert _resolve_provider(None)[0] == "ollama"
+
+
+def test_native_clients_pooled_per_event_loop():
+    """Same loop reuses one SDK client; a different loop gets its own."""
+    from tarotcli.ai import _native_client
+
+    async def get_client():
+        return _native_client(("test-sdk",), object)
+
+    async def get_twice():
+        return await get_client(), await get_client()
+
+    first, second = asyncio.run(get_twice())
+    other_loop_client = asyncio.run(get_client())
+
+    assert first is second
+    assert other_loop_client is not first
+
+
+class _RateLimited(Exception):
+    """Stand-in for a provider 429 error."""
+
+    status_code = 429
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_call_is_retried(sample_reading, mock_config):
+    """HTTP 429 responses are retried with backoff until success."""
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="After retry"))]
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai._RETRY_BASE_DELAY", 0),
+        patch(
+            "tarotcli.ai.acompletion",
+            side_effect=[_RateLimited(), _RateLimited(), mock_response],
+        ) as mock_call,
+    ):
+        result = await interpret_reading(sample_reading)
+
+    assert result == "After retry"
+    assert mock_call.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stalled_attempt_is_retried_within_request_timeout(
+    sample_reading, mock_config
+):
+    """An attempt exceeding request_timeout is abandoned and retried."""
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Second try"))]
+    calls = []
+
+    async def stall_then_answer(**kwargs):
+        calls.append(kwargs["timeout"])
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return mock_response
+
+    mock_config.get_model_config.side_effect = None
+    mock_config.get_model_config.return_value = {
+        "model": "claude-sonnet-4-20250514",
+        "request_timeout": 0.05,
+    }
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai._RETRY_BASE_DELAY", 0),
+        patch("tarotcli.ai.acompletion", side_effect=stall_then_answer),
+    ):
+        result = await asyncio.wait_for(interpret_reading(sample_reading), timeout=2)
+
+    assert result == "Second try"
+    assert calls == [0.05, 0.05]
+
+
+@pytest.mark.asyncio
+async def test_non_rate_limit_errors_are_not_retried(sample_reading, mock_config):
+    """Other API errors fall back to static immediately."""
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=Exception("boom")) as mock_call,
+    ):
+        result = await interpret_reading(sample_reading)
+
+    assert result == sample_reading.static_interpretation
+    assert mock_call.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_interpret_many_returns_one_result_per_reading(
+    sample_reading, mock_config
+):
+    """Batch interpretation should return results in input order."""
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Batch result"))]
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", return_value=mock_response) as mock_call,
+    ):
+        results = await interpret_many([sample_reading] * 3)
+
+        assert results == ["Batch result"] * 3
+        assert mock_call.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_interpret_many_respects_max_concurrency(sample_reading, mock_config):
+    """No more than max_concurrency API calls should be in flight at once."""
+
+    in_flight = 0
+    peak = 0
+
+    async def slow_completion(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="ok"))]
+        return response
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=slow_completion),
+    ):
+        results = await interpret_many([sample_reading] * 6, max_concurrency=2)
+
+        assert results == ["ok"] * 6
+        assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_interpret_many_degrades_per_reading(sample_reading, mock_config):
+    """A failed call should fall back to static without affecting the others."""
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="AI text"))]
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch(
+            "tarotcli.ai.acompletion",
+            side_effect=[mock_response, Exception("API Error"), mock_response],
+        ),
+    ):
+        results = await interpret_many([sample_reading] * 3, max_concurrency=1)
+
+        assert results == [
+            "AI text",
+            sample_reading.static_interpretation,
+            "AI text",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_interpret_many_reports_failures_in_one_line(
+    sample_reading, mock_config, capsys
+):
+    """Batch failures are summarised once instead of printed per reading."""
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=ValueError("bad")),
+    ):
+        await interpret_many([sample_reading] * 3)
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert lines == [
+        "API errors for 3 of 3 readings (ValueError x3), using static interpretation"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_interpret_reading_propagates_cancellation(sample_reading, mock_config):
+    """Cancelling the caller cancels the API call instead of degrading."""
+    started = asyncio.Event()
+
+    async def hang(**kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=hang),
+    ):
+        task = asyncio.create_task(interpret_reading(sample_reading))
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+@pytest.mark.asyncio
+async def test_interpret_many_propagates_cancellation(sample_reading, mock_config):
+    """Cancelling a batch cancels its API calls instead of degrading them."""
+    started = asyncio.Event()
+
+    async def hang(**kwargs):
+        started.set()
+        await asyncio.sleep(10)
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=hang),
+    ):
+        task = asyncio.create_task(interpret_many([sample_reading] * 3))
+        await started.wait()
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+def test_interpret_many_sync_without_api_key(sample_reading, mock_config):
+    """Missing API key should return static interpretation for every reading."""
+
+    mock_config.get_api_key.side_effect = lambda provider=None: None
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion") as mock_call,
+    ):
+        results = interpret_many_sync([sample_reading, sample_reading])
+
+        assert results == [sample_reading.static_interpretation] * 2
+        assert not mock_call.called
+
+
+def _stream_response(*deltas):
+    """Build an async iterator of LiteLLM-style streaming chunks."""
+
+    async def _chunks():
+        for delta in deltas:
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=delta))])
+
+    return _chunks()
+
+
+@pytest.mark.asyncio
+async def test_interpret_reading_stream_yields_chunks(sample_reading, mock_config):
+    """Streaming yields non-empty deltas in order with stream=True."""
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch(
+            "tarotcli.ai.acompletion",
+            return_value=_stream_response("The ", None, "cards ", "", "speak."),
+        ) as mock_call,
+    ):
+        chunks = [c async for c in interpret_reading_stream(sample_reading)]
+
+    assert chunks == ["The ", "cards ", "speak."]
+    assert mock_call.call_args.kwargs["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_interpret_reading_stream_skips_chunks_without_choices(
+    sample_reading, mock_config
+):
+    """Chunks with an empty choices list (e.g. usage-only) are skipped."""
+
+    async def _chunks():
+        yield MagicMock(choices=[MagicMock(delta=MagicMock(content="The cards"))])
+        yield MagicMock(choices=[])
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", return_value=_chunks()),
+    ):
+        chunks = [c async for c in interpret_reading_stream(sample_reading)]
+
+    assert chunks == ["The cards"]
+
+
+@pytest.mark.asyncio
+async def test_interpret_reading_stream_without_api_key(sample_reading, mock_config):
+    """Missing API key yields the static interpretation as one chunk."""
+    mock_config.get_api_key.side_effect = None
+    mock_config.get_api_key.return_value = None
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion") as mock_call,
+    ):
+        chunks = [c async for c in interpret_reading_stream(sample_reading)]
+
+    assert chunks == [sample_reading.static_interpretation]
+    mock_call.assert_not_called()
+
+
+def test_interpret_reading_stream_sync_wrapper(sample_reading, mock_config):
+    """Sync wrapper steps the stream on the background loop."""
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch(
+            "tarotcli.ai.acompletion",
+            return_value=_stream_response("Past ", "meets ", "future."),
+        ),
+    ):
+        chunks = list(interpret_reading_stream_sync(sample_reading))
+
+    assert chunks == ["Past ", "meets ", "future."]
+
+
 def test_build_interpretation_prompt_includes_spread_type(sample_reading):
     """Prompt should include spread type."""
     prompt = _build_interpretation_prompt(sample_reading)
@@ -212,6 +698,71 @@ def test_build_interpretation_prompt_includes_guidelines(sample_reading):
     assert "practical" in prompt.lower() or "actionable" in prompt.lower()
 
 
+def test_build_interpretation_prompt_memoized_for_same_reading(sample_reading):
+    """Rebuilding the prompt for an unchanged reading reuses the cached strings."""
+    first = _build_prompt_parts(sample_reading)
+    second = _build_prompt_parts(sample_reading)
+
+    assert first[0] is second[0]
+    assert first[1] is second[1]
+
+    sample_reading.question = "A different question"
+    assert _build_prompt_parts(sample_reading)[1] != first[1]
+
+
+def test_user_prompt_lists_celtic_cross_cards_in_position_order(deck):
+    """Every card block appears once, in spread order, for a 10-card spread."""
+    from tarotcli.spreads import get_spread
+
+    deck.shuffle(seed=11)
+    reading = get_spread("celtic").create_reading(
+        cards=deck.draw(10), focus_area=FocusArea.GENERAL, question=None
+    )
+
+    _, user = _build_prompt_parts(reading)
+
+    offsets = []
+    for card in reading.cards:
+        orientation = "Reversed" if card.reversed else "Upright"
+        block = f"**{card.position_meaning}**: {card.card.name} ({orientation})\n"
+        assert user.count(block) == 1
+        offsets.append(user.index(block))
+    assert offsets == sorted(offsets)
+
+
+def test_prompt_parts_keep_reading_content_out_of_system_prompt(sample_reading):
+    """System prompt depends only on focus area; cards go in the user prompt."""
+    system, user = _build_prompt_parts(sample_reading)
+
+    assert FOCUS_CONTEXTS[sample_reading.focus_area] in system
+    assert "Please provide a cohesive interpretation" in system
+    for card in sample_reading.cards:
+        assert card.card.name not in system
+        assert card.card.name in user
+    assert sample_reading.question in user
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_sent_as_plain_system_message(sample_reading, mock_config):
+    """Every provider gets the system prompt as its own message before the cards."""
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="Test"))]
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", return_value=mock_response) as mock_call,
+    ):
+        await interpret_reading(sample_reading)
+        await interpret_reading(sample_reading, provider="ollama")
+
+    system, prompt = _build_prompt_parts(sample_reading)
+    for call in mock_call.call_args_list:
+        assert call.kwargs["messages"] == [
+            {"role": "system", "content": system},
+            {"role": "user", "content": prompt},
+        ]
+
+
 def test_interpret_reading_sync_wrapper(sample_reading, mock_config):
     """Sync wrapper should execute async function and return result."""
 
@@ -247,6 +798,88 @@ def test_interpret_reading_sync_passes_kwargs(sample_reading, mock_config):
         assert result == "Test result"
 
 
+def test_interpret_reading_sync_reuses_event_loop(sample_reading, mock_config):
+    """Repeated sync calls should run on the same persistent event loop."""
+
+    loops = []
+
+    async def record_loop(**kwargs):
+        loops.append(asyncio.get_running_loop())
+        response = MagicMock()
+        response.choices = [MagicMock(message=MagicMock(content="Test"))]
+        return response
+
+    with (
+        patch("tarotcli.ai.get_config", return_value=mock_config),
+        patch("tarotcli.ai.acompletion", side_effect=record_loop),
+    ):
+        interpret_reading_sync(sample_reading)
+        interpret_reading_sync(sample_reading)
+
+    assert len(loops) == 2
+    assert loops[0] is loops[1]
+
+
+@pytest.mark.asyncio
+async def test_interpret_reading_sync_inside_running_loop(sample_reading, mock_config):
+    """Sync wrapper works when called with an event loop already running."""
+
+    with patch("tarotcli.ai.get_config", return_value=mock_config):
+        mock_config.get_api_key.side_effect = lambda provider=None: None
+        result = interpret_reading_sync(sample_reading)
+
+    assert result == sample_reading.static_interpretation
+
+
+def test_interpret_reading_sync_from_background_loop_does_not_deadlock(
+    sample_reading, mock_config
+):
+    """Calling the sync wrapper from a coroutine on the background loop completes."""
+    from tarotcli.ai import _get_loop
+
+    async def nested():
+        return interpret_reading_sync(sample_reading)
+
+    with patch("tarotcli.ai.get_config", return_value=mock_config):
+        mock_config.get_api_key.side_effect = lambda provider=None: None
+        future = asyncio.run_coroutine_threadsafe(nested(), _get_loop())
+        result = future.result(timeout=5)
+
+    assert result == sample_reading.static_interpretation
+
+
+def test_importing_ai_module_defers_litellm():
+    """LiteLLM is only imported on first API call, not at module import."""
+    import subprocess
+    import sys
+
+    code = "import sys, tarotcli.ai; print('litellm' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_prewarm_loads_litellm_in_background():
+    """prewarm() imports LiteLLM on a worker thread, once."""
+    import threading
+    from tarotcli.ai import prewarm
+
+    loaded = threading.Event()
+    loader = MagicMock(side_effect=loaded.set)
+    loader.cache_info.return_value.currsize = 0
+
+    with patch("tarotcli.ai._load_litellm", loader):
+        prewarm()
+        assert loaded.wait(timeout=2)
+
+        loader.cache_info.return_value.currsize = 1
+        prewarm()
+
+    assert loader.call_count == 1
+
+
 def test_focus_contexts_complete():
     """All FocusArea enum values should have context templates."""
     for focus_area in FocusArea:
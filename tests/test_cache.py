@@ -0,0 +1,104 @@
+"""Tests for the AI interpretation response cache.
+
+All tests use temporary directories to avoid polluting user cache.
+"""
+
+import pytest
+
+from tarotcli.cache import InterpretationCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Cache instance with temporary path and no expiry."""
+    return InterpretationCache(tmp_path / "interpretations.jsonl")
+
+
+def test_make_key_is_deterministic():
+    """Same inputs produce the same key; any change produces a different key."""
+    key = InterpretationCache.make_key("claude", "model-a", "prompt")
+
+    assert key == InterpretationCache.make_key("claude", "model-a", "prompt")
+    assert key != InterpretationCache.make_key("ollama", "model-a", "prompt")
+    assert key != InterpretationCache.make_key("claude", "model-b", "prompt")
+    assert key != InterpretationCache.make_key("claude", "model-a", "prompt!")
+
+
+def test_get_returns_none_when_file_missing(cache):
+    """Missing cache file is a miss, not an error."""
+    assert cache.get("anything") is None
+
+
+def test_set_then_get_round_trip(cache):
+    """Stored interpretation is returned for its key."""
+    assert cache.set("k1", "The Fool begins a journey") is True
+
+    assert cache.get("k1") == "The Fool begins a journey"
+    assert cache.get("k2") is None
+
+
+def test_latest_entry_wins(cache):
+    """Re-setting a key supersedes the earlier entry."""
+    cache.set("k1", "first")
+    cache.set("k1", "second")
+
+    assert cache.get("k1") == "second"
+
+
+def test_expired_entry_is_a_miss(tmp_path):
+    """Entries older than ttl are ignored."""
+    cache = InterpretationCache(tmp_path / "interpretations.jsonl", ttl=-1)
+    cache.set("k1", "stale")
+
+    assert cache.get("k1") is None
+
+
+def test_skips_corrupt_lines(cache):
+    """Partial writes don't break lookups of valid entries."""
+    cache.set("k1", "valid")
+    with open(cache.cache_path, "a") as f:
+        f.write("{not json\n")
+
+    assert cache.get("k1") == "valid"
+
+
+def test_lookups_after_first_use_do_not_reread_file(cache):
+    """Entries are served from memory once hydrated."""
+    cache.set("k1", "in memory")
+    cache.cache_path.unlink()
+
+    assert cache.get("k1") == "in memory"
+
+
+def test_new_instance_hydrates_from_disk(tmp_path):
+    """Entries written by one instance are visible to a fresh one."""
+    path = tmp_path / "interpretations.jsonl"
+    InterpretationCache(path).set("k1", "persisted")
+
+    assert InterpretationCache(path).get("k1") == "persisted"
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """Beyond max_entries, the least recently used entry is dropped."""
+    cache = InterpretationCache(tmp_path / "interpretations.jsonl", max_entries=2)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", "C")
+
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+
+def test_hydration_compacts_stale_lines(tmp_path):
+    """Superseded and evicted lines are removed from disk on next load."""
+    path = tmp_path / "interpretations.jsonl"
+    writer = InterpretationCache(path)
+    writer.set("k1", "old")
+    writer.set("k1", "new")
+    writer.set("k2", "other")
+
+    reader = InterpretationCache(path)
+    assert reader.get("k1") == "new"
+    assert len(path.read_text().splitlines()) == 2
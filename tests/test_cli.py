@@ -5,7 +5,7 @@ import json
 from typer.testing import CliRunner
 from unittest.mock import Mock, patch
 
-from tarotcli.cli import app
+from tarotcli.cli import app, _persistence
 from tarotcli.models import FocusArea
 
 runner = CliRunner()
@@ -14,8 +14,34 @@ runner = CliRunner()
 @pytest.fixture(autouse=True)
 def disable_persistence():
     """Prevent tests from writing to real persistence storage."""
-    with patch("tarotcli.cli.ReadingPersistence"):
+    _persistence.cache_clear()
+    with patch("tarotcli.persistence.ReadingPersistence"):
         yield
+    _persistence.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def no_prewarm():
+    """Keep read from importing LiteLLM in the background during tests."""
+    with patch("tarotcli.ai.prewarm") as mock_prewarm:
+        yield mock_prewarm
+
+
+def test_cli_import_defers_ai_and_persistence():
+    """Importing the CLI should not load AI or persistence modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, tarotcli.cli; "
+        "print(sorted(m for m in ('tarotcli.ai', 'tarotcli.persistence') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
 
 
 def test_version_command():
@@ -51,6 +77,7 @@ def test_read_command_no_ai_json_output():
     """Read command with --json and --no-ai should output valid JSON."""
     mock_deck = Mock()
     mock_deck.load_default.return_value = mock_deck
+    mock_deck.clone.return_value = mock_deck
 
     # Mock card data
     mock_card = Mock()
@@ -118,6 +145,7 @@ def test_read_command_missing_spread_prompt_interactive():
 
         mock_deck = Mock()
         mock_deck.load_default.return_value = mock_deck
+        mock_deck.clone.return_value = mock_deck
         mock_deck.draw.return_value = [Mock()]  # Need at least one mock card
 
         mock_spread = Mock()
@@ -156,6 +184,7 @@ def test_read_command_provider_override():
     """Should allow AI provider override via CLI."""
     mock_deck = Mock()
     mock_deck.load_default.return_value = mock_deck
+    mock_deck.clone.return_value = mock_deck
     mock_deck.draw.return_value = [Mock()]  # Provide mock cards
 
     mock_spread = Mock()
@@ -172,7 +201,7 @@ def test_read_command_provider_override():
     with (
         patch("tarotcli.cli.TarotDeck.load_default", return_value=mock_deck),
         patch("tarotcli.cli.get_spread", return_value=mock_spread),
-        patch("tarotcli.cli.interpret_reading_sync") as mock_ai,
+        patch("tarotcli.ai.interpret_reading_sync") as mock_ai,
         patch("tarotcli.cli.display_reading"),
     ):
         mock_ai.return_value = "Mock AI interpretation"
@@ -197,10 +226,104 @@ def test_read_command_provider_override():
         assert call_args.kwargs.get("provider") == "ollama"
 
 
+def test_read_command_streams_interpretation_on_terminal():
+    """On a terminal, AI text is streamed rather than fetched in one call."""
+    mock_deck = Mock()
+    mock_deck.load_default.return_value = mock_deck
+    mock_deck.clone.return_value = mock_deck
+    mock_deck.draw.return_value = [Mock()]
+
+    mock_spread = Mock()
+    mock_spread.card_count.return_value = 1
+    mock_reading = Mock()
+    mock_spread.create_reading.return_value = mock_reading
+
+    with (
+        patch("tarotcli.cli.TarotDeck.load_default", return_value=mock_deck),
+        patch("tarotcli.cli.get_spread", return_value=mock_spread),
+        patch("tarotcli.cli.console") as mock_console,
+        patch(
+            "tarotcli.cli._stream_interpretation", return_value="Streamed text"
+        ) as mock_stream,
+        patch("tarotcli.ai.interpret_reading_sync") as mock_ai,
+        patch("tarotcli.cli.display_reading"),
+    ):
+        mock_console.is_terminal = True
+
+        result = runner.invoke(
+            app, ["read", "--spread", "single", "--focus", "general"]
+        )
+
+        assert result.exit_code == 0
+        mock_stream.assert_called_once_with(mock_reading, None)
+        mock_ai.assert_not_called()
+        assert mock_reading.interpretation == "Streamed text"
+
+
+def test_stream_interpretation_keeps_partial_text_on_provider_error(capsys):
+    """A stream that fails mid-way keeps the shown text without a second call."""
+    from tarotcli.cli import _stream_interpretation
+
+    def interrupted(reading, provider=None):
+        yield "The Tower "
+        raise TimeoutError
+
+    with (
+        patch("tarotcli.ai.interpret_reading_stream_sync", side_effect=interrupted),
+        patch("tarotcli.ai.interpret_reading_sync") as mock_ai,
+    ):
+        assert _stream_interpretation(Mock(), None) == "The Tower "
+
+    mock_ai.assert_not_called()
+    assert "AI stream interrupted (TimeoutError)" in capsys.readouterr().out
+
+
+def test_stream_interpretation_falls_back_before_first_chunk(capsys):
+    """A provider error before any text retries once without streaming."""
+    from tarotcli.cli import _stream_interpretation
+
+    with (
+        patch(
+            "tarotcli.ai.interpret_reading_stream_sync",
+            side_effect=ConnectionError("refused"),
+        ),
+        patch("tarotcli.ai.interpret_reading_sync", return_value="AI text") as mock_ai,
+    ):
+        assert _stream_interpretation(Mock(), "ollama") == "AI text"
+
+    mock_ai.assert_called_once()
+    assert "AI streaming failed (ConnectionError)" in capsys.readouterr().out
+
+
+def test_stream_interpretation_propagates_bugs():
+    """Non-provider exceptions are not swallowed by the streaming fallback."""
+    from tarotcli.cli import _stream_interpretation
+
+    with (
+        patch("tarotcli.ai.interpret_reading_stream_sync", side_effect=KeyError("bug")),
+        patch("tarotcli.ai.interpret_reading_sync") as mock_ai,
+        pytest.raises(KeyError),
+    ):
+        _stream_interpretation(Mock(), None)
+
+    mock_ai.assert_not_called()
+
+
+def test_read_command_prewarms_ai_unless_disabled(no_prewarm):
+    """read starts the LiteLLM import early, but not with --no-ai."""
+    with patch("tarotcli.ai.interpret_reading_sync", return_value="AI text"):
+        runner.invoke(app, ["read", "--spread", "single", "--focus", "general"])
+    assert no_prewarm.call_count == 1
+
+    runner.invoke(app, ["read", "--spread", "single", "--focus", "general", "--no-ai"])
+    assert no_prewarm.call_count == 1
+
+
 def test_read_command_ai_error_graceful_degradation():
     """Should fall back to static interpretation when AI interpretation fails."""
     mock_deck = Mock()
     mock_deck.load_default.return_value = mock_deck
+    mock_deck.clone.return_value = mock_deck
     mock_deck.draw.return_value = [Mock()]  # Provide mock cards
 
     mock_spread = Mock()
@@ -221,7 +344,7 @@ def test_read_command_ai_error_graceful_degradation():
     with (
         patch("tarotcli.cli.TarotDeck.load_default", return_value=mock_deck),
         patch("tarotcli.cli.get_spread", return_value=mock_spread),
-        patch("tarotcli.cli.interpret_reading_sync") as mock_ai,
+        patch("tarotcli.ai.interpret_reading_sync") as mock_ai,
         patch("tarotcli.cli.display_reading") as mock_display,
         patch("tarotcli.cli.get_config", return_value=mock_config),
     ):
@@ -255,6 +378,7 @@ def test_read_command_all_spreads(spread_type):
     """Should accept all valid spread types."""
     mock_deck = Mock()
     mock_deck.load_default.return_value = mock_deck
+    mock_deck.clone.return_value = mock_deck
     mock_deck.draw.return_value = [Mock()]  # Provide mock cards
 
     mock_spread = Mock()
@@ -426,5 +550,107 @@ def test_lookup_command_error_handling():
         assert "Error" in result.stdout
 
 
+def test_history_reinterpret_uses_batch_interpretation():
+    """--reinterpret should interpret all loaded readings in one batch call."""
+    readings = [Mock(interpretation=None, timestamp=None) for _ in range(3)]
+
+    mock_config = Mock()
+    mock_config.get.return_value = True  # output.save_readings enabled
+
+    with (
+        patch("tarotcli.cli.get_config", return_value=mock_config),
+        patch("tarotcli.persistence.ReadingPersistence") as mock_persistence,
+        patch(
+            "tarotcli.ai.interpret_many_sync", return_value=["A", "B", "C"]
+        ) as mock_batch,
+        patch("tarotcli.cli.display_readings") as mock_display,
+    ):
+        mock_persistence.return_value.load_last.return_value = readings
+
+        result = runner.invoke(app, ["history", "--last", "3", "--reinterpret"])
+
+    assert result.exit_code == 0
+    mock_batch.assert_called_once_with(readings, provider=None)
+    assert [r.interpretation for r in readings] == ["A", "B", "C"]
+    mock_display.assert_called_once()
+    assert mock_display.call_args.args[0] is readings
+
+
+def test_history_json_outputs_array_of_readings(sample_reading):
+    """history --json should print every loaded reading as a JSON array."""
+    mock_config = Mock()
+    mock_config.get.return_value = True  # output.save_readings enabled
+
+    with (
+        patch("tarotcli.cli.get_config", return_value=mock_config),
+        patch("tarotcli.persistence.ReadingPersistence") as mock_persistence,
+    ):
+        mock_persistence.return_value.load_last.return_value = [sample_reading] * 2
+
+        result = runner.invoke(app, ["history", "--json"])
+
+    assert result.exit_code == 0
+    data = json.loads(result.stdout)
+    assert len(data) == 2
+    assert data[0] == json.loads(sample_reading.model_dump_json())
+
+
+def test_read_command_saves_after_output():
+    """Auto-save runs after the reading is printed, so its warnings follow it."""
+    mock_config = Mock()
+    mock_config.get.return_value = True  # output.save_readings enabled
+
+    with (
+        patch("tarotcli.cli.get_config", return_value=mock_config),
+        patch("tarotcli.persistence.ReadingPersistence") as mock_persistence,
+    ):
+        mock_persistence.return_value.save.side_effect = lambda reading: print(
+            "⚠️  Failed to save reading: disk full"
+        )
+
+        result = runner.invoke(
+            app,
+            ["read", "--spread", "single", "--focus", "general", "--no-ai", "--json"],
+        )
+
+    assert result.exit_code == 0
+    document, warning = result.stdout.split("⚠️")
+    assert json.loads(document)["spread_type"] == "single_card"
+    assert "disk full" in warning
+    mock_persistence.return_value.save.assert_called_once()
+
+
+def test_display_readings_writes_history_in_one_print(sample_reading):
+    """History on a terminal should render every reading in one console write."""
+    from tarotcli.ui import display_readings
+
+    with (
+        patch("tarotcli.ui._is_terminal", return_value=True),
+        patch("tarotcli.ui.console") as mock_console,
+    ):
+        display_readings([sample_reading] * 3, show_static=True)
+
+    mock_console.print.assert_called_once()
+
+
+def test_is_terminal_follows_stdout_redirection():
+    """The TTY check follows whatever sys.stdout currently is."""
+    import contextlib
+    import io
+
+    from tarotcli.ui import _is_terminal
+
+    tty = Mock()
+    tty.isatty.return_value = True
+    with contextlib.redirect_stdout(tty):
+        assert _is_terminal() is True
+        assert _is_terminal() is True
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert _is_terminal() is False
+    tty.isatty.return_value = False
+    with contextlib.redirect_stdout(tty):
+        assert _is_terminal() is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -15,7 +15,7 @@ from unittest.mock import patch
 
 import pytest
 
-from tarotcli.config import Config, get_config
+from tarotcli.config import Config, _load_yaml_cached, get_config, reload_config
 
 
 @pytest.fixture
@@ -57,6 +57,27 @@ class TestConfigLoading:
         assert "model" in claude_config
         assert "temperature" in claude_config
 
+    def test_defaults_match_safe_load(self, clean_environment):
+        """The C-accelerated loader parses default.yaml exactly like safe_load."""
+        import yaml
+
+        default_path = Path(__file__).parent.parent / "src/tarotcli/default.yaml"
+        with open(default_path) as f:
+            expected = yaml.safe_load(f)
+
+        assert Config()._system_config == expected
+
+    def test_yaml_parse_reused_until_file_changes(self, tmp_path):
+        """Unchanged files reuse the cached parse; edits are picked up."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("a: 1\n")
+
+        first = _load_yaml_cached(config_path)
+        assert _load_yaml_cached(config_path) is first
+
+        config_path.write_text("a: 22\n")  # Size changes even if mtime doesn't
+        assert _load_yaml_cached(config_path) == {"a": 22}
+
     def test_deep_merge_preserves_unmodified_keys(self, clean_environment):
         """Deep merge should preserve nested keys not explicitly overridden."""
         config = Config()
@@ -65,6 +86,22 @@ class TestConfigLoading:
         max_tokens = config.get("models.providers.claude.max_tokens")
         assert max_tokens == 2000  # From default.yaml
 
+    def test_deep_merge_overrides_nested_key_without_mutating_defaults(
+        self, monkeypatch
+    ):
+        """A partial override replaces one leaf and leaves the parsed defaults intact."""
+        monkeypatch.setattr(
+            "tarotcli.config.Config._load_user_config",
+            lambda self: {"models": {"providers": {"claude": {"temperature": 0.1}}}},
+        )
+        config = Config()
+
+        assert config.get("models.providers.claude.temperature") == 0.1
+        assert config.get("models.providers.claude.max_tokens") == 2000
+        defaults = config._system_config["models"]["providers"]
+        assert config.get("models.providers.ollama") is defaults["ollama"]
+        assert defaults["claude"]["temperature"] != 0.1
+
 
 class TestConfigGet:
     """Test config.get() method with dot notation and hierarchy."""
@@ -95,6 +132,14 @@ class TestConfigGet:
         result = config.get("nonexistent.key")
         assert result is None
 
+    def test_get_section_and_path_through_leaf(self, clean_environment):
+        """Section paths return the nested dict; paths below a leaf miss."""
+        config = Config()
+
+        claude = config.get("models.providers.claude")
+        assert claude["max_tokens"] == 2000
+        assert config.get("models.default_provider.model", default="x") == "x"
+
     def test_environment_variable_overrides_config(
         self, clean_environment, monkeypatch
     ):
@@ -167,6 +212,31 @@ class TestEnvValueParsing:
         assert result == "claude-sonnet-4"
         assert isinstance(result, str)
 
+    def test_parse_negative_integer_and_non_numeric_lookalikes(
+        self, clean_environment, monkeypatch
+    ):
+        """Negative ints parse; dotted or digit-ish non-numbers stay strings."""
+        config = Config()
+
+        monkeypatch.setenv("TAROTCLI_TEST_NEG", "-42")
+        monkeypatch.setenv("TAROTCLI_TEST_HOST", "127.0.0.1")
+        monkeypatch.setenv("TAROTCLI_TEST_SUPER", "²")
+
+        assert config.get("test.neg") == -42
+        assert config.get("test.host") == "127.0.0.1"
+        assert config.get("test.super") == "²"
+
+    def test_parse_integer_forms_accepted_by_int(self, clean_environment, monkeypatch):
+        """Signs, surrounding whitespace and digit underscores still parse as ints."""
+        config = Config()
+
+        for raw, expected in [("+5", 5), (" 42", 42), ("42 ", 42), ("1_000", 1000)]:
+            monkeypatch.setenv("TAROTCLI_TEST_INT", raw)
+            assert config.get("test.int") == expected, f"Failed to parse {raw!r}"
+
+        monkeypatch.setenv("TAROTCLI_TEST_FLOAT", " 0.5 ")
+        assert config.get("test.float") == 0.5
+
 
 class TestGetModelConfig:
     """Test get_model_config() convenience method."""
@@ -378,6 +448,34 @@ class TestGetReadingsPath:
         assert path.name == "readings.jsonl"
 
 
+class TestDotenv:
+    """Test .env loading at import."""
+
+    def test_ignores_dotenv_in_working_directory(self, tmp_path):
+        """A .env in the directory tarotcli runs from is not loaded."""
+        import subprocess
+        import sys
+
+        (tmp_path / ".env").write_text("TAROTCLI_TEST_DOTENV=from-cwd\n")
+        # Run as a script: python-dotenv's own search treats `python -c` as
+        # interactive and would look in the working directory regardless
+        script = tmp_path / "check.py"
+        script.write_text(
+            "import os, tarotcli.config\nprint(os.environ.get('TAROTCLI_TEST_DOTENV'))\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "TAROTCLI_USE_DOTENV"}
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=tmp_path,
+            env=env,
+        )
+
+        assert result.stdout.strip() == "None"
+
+
 class TestSingletonPattern:
     """Test get_config() singleton function."""
 
@@ -393,6 +491,32 @@ class TestSingletonPattern:
         config = get_config()
         assert isinstance(config, Config)
 
+    def test_import_does_not_load_config(self, tmp_path):
+        """A malformed user config.yaml must not break importing the module."""
+        import subprocess
+        import sys
+
+        (tmp_path / "tarotcli").mkdir()
+        (tmp_path / "tarotcli" / "config.yaml").write_text("models: [\n  bad")
+        code = "import tarotcli.config as c; print(c._config)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "XDG_CONFIG_HOME": str(tmp_path)},
+        )
+
+        assert result.stdout.strip() == "None"
+
+    def test_reload_config_replaces_singleton(self):
+        """reload_config() should install a fresh instance for get_config()."""
+        old = get_config()
+        new = reload_config()
+
+        assert new is not old
+        assert get_config() is new
+
 
 class TestConfigurationHierarchy:
     """Integration tests for three-tier hierarchy."""
@@ -2,6 +2,7 @@ import pytest
 from pathlib import Path
 from tarotcli.deck import TarotDeck
 from collections import Counter
+from pydantic import ValidationError
 
 
 def test_deck_loads_78_cards(deck_path):
@@ -11,6 +12,69 @@ def test_deck_loads_78_cards(deck_path):
     assert len(deck.remaining) == 78
 
 
+def test_decks_share_parsed_cards_but_not_state(deck_path):
+    """Repeat loads reuse parsed cards; each deck keeps its own remaining list."""
+    first = TarotDeck(deck_path)
+    second = TarotDeck(deck_path)
+
+    assert first.cards[0] is second.cards[0]
+
+    first.draw(5)
+    assert len(first.remaining) == 73
+    assert len(second.remaining) == 78
+
+
+def test_clone_has_independent_state(deck_path):
+    """Clone shares cards but shuffles/draws without touching the original."""
+    template = TarotDeck(deck_path)
+    deck = template.clone()
+
+    deck.shuffle(seed=7)
+    deck.draw(10)
+
+    assert len(deck.remaining) == 68
+    assert len(template.remaining) == 78
+    assert deck.cards[0] is template.cards[0]
+
+
+def test_deck_cards_are_immutable_and_shared_with_clone(deck_path):
+    """Canonical cards are one shared tuple of frozen cards; resets rebuild remaining."""
+    deck = TarotDeck(deck_path)
+    clone = deck.clone()
+
+    assert isinstance(deck.cards, tuple)
+    assert clone.cards is deck.cards
+
+    clone.shuffle(seed=3)
+    clone.draw(5)
+    clone.reset()
+
+    assert clone.remaining == list(deck.cards)
+    assert clone.remaining is not deck.remaining
+
+    with pytest.raises(ValidationError):
+        deck.cards[0].name = "Changed"
+
+
+def test_load_default_reuses_deck_until_file_changes(deck_path, tmp_path, monkeypatch):
+    """load_default returns independent clones and re-parses an edited file."""
+    data_file = tmp_path / "tarot_cards_RW.jsonl"
+    data_file.write_bytes(deck_path.read_bytes())
+    monkeypatch.setenv("TAROTCLI_DATA_DIR", str(tmp_path))
+
+    first = TarotDeck.load_default()
+    first.draw(5)
+    second = TarotDeck.load_default()
+
+    assert len(second.remaining) == 78
+    assert second.cards[0] is first.cards[0]  # Same parse, shared cards
+
+    data_file.write_bytes(data_file.read_bytes().replace(b"The Magician", b"The Magus"))
+    edited = TarotDeck.load_default()
+
+    assert "The Magus" in {card.name for card in edited.cards}
+
+
 def test_deck_shuffle_maintains_card_count(deck_path):
     """Shuffling should reset to 78 cards."""
     deck = TarotDeck(deck_path)
@@ -69,6 +133,18 @@ def test_draw_depletes_deck(deck_path):
     assert len(drawn_ids & remaining_ids) == 0  # No overlap
 
 
+def test_draw_takes_cards_from_top_in_order(deck_path):
+    """Draws come off the front of remaining in order across calls."""
+    deck = TarotDeck(deck_path)
+    deck.shuffle(seed=7)
+    expected = deck.remaining[:5]
+
+    drawn = deck.draw(2) + deck.draw(3)
+
+    assert [dc.card for dc in drawn] == expected
+    assert deck.remaining[0] not in expected
+
+
 def test_reversal_distribution_over_500_draws(deck_path):
     """Over 500 draws, reversals should approximate 50% (±10%)."""
     deck = TarotDeck(deck_path)
@@ -110,6 +186,36 @@ def test_card_distribution_over_500_draws(deck_path):
         assert count == 7, f"Card {card_id} appeared {count} times (expected 7)"
 
 
+def test_shuffle_with_seed_is_reproducible(deck_path):
+    """Same seed produces the same order; shuffle is a permutation."""
+    deck = TarotDeck(deck_path)
+
+    deck.shuffle(seed=42)
+    first = [c.id for c in deck.remaining]
+    deck.shuffle(seed=42)
+    second = [c.id for c in deck.remaining]
+
+    assert first == second
+    assert sorted(first) == sorted(c.id for c in deck.cards)
+
+
+def test_batched_shuffle_is_uniform_on_small_lists():
+    """Every permutation of a small list occurs with roughly equal frequency."""
+    import random
+    from tarotcli.deck import _batched_shuffle
+
+    random.seed(0)
+    counts = Counter()
+    for _ in range(24000):
+        items = [0, 1, 2, 3]
+        _batched_shuffle(items)
+        counts[tuple(items)] += 1
+
+    assert len(counts) == 24
+    # Expected 1000 each; allow generous statistical tolerance
+    assert all(800 < n < 1200 for n in counts.values())
+
+
 def test_draw_raises_on_insufficient_cards(deck_path):
     """Cannot draw more cards than remaining."""
     deck = TarotDeck(deck_path)
@@ -131,6 +237,26 @@ def test_deck_rejects_invalid_jsonl(tmp_path):
         TarotDeck(bad_file)
 
 
+def test_deck_invalid_jsonl_reports_later_line_number(tmp_path):
+    """The reported line counts blank lines and valid lines before the bad one."""
+    source = Path("data/tarot_cards_RW.jsonl").read_text().splitlines()
+    bad_file = tmp_path / "bad.jsonl"
+    bad_file.write_text("\n".join([source[0], "", "{broken"]) + "\n")
+
+    with pytest.raises(ValueError, match="Invalid JSON at line 3"):
+        TarotDeck(bad_file)
+
+
+def test_deck_rejects_two_cards_on_one_line(tmp_path):
+    """Whole-file validation still requires exactly one JSON value per line."""
+    source = Path("data/tarot_cards_RW.jsonl").read_text().splitlines()
+    bad_file = tmp_path / "bad.jsonl"
+    bad_file.write_text(f"{source[0]},{source[1]}\n" + "\n".join(source[2:]) + "\n")
+
+    with pytest.raises(ValueError, match="Invalid JSON at line 1"):
+        TarotDeck(bad_file)
+
+
 def test_deck_rejects_incomplete_cards(tmp_path):
     """JSONL with missing fields should raise validation error."""
     bad_file = tmp_path / "incomplete.jsonl"
@@ -101,3 +101,24 @@ def test_lookup_alias_coins(deck):
     result = lookup_card(deck, "two of coins")
     assert result is not None
     assert result.name == "Two of Pentacles"
+
+
+def test_lookup_exact_name_and_clone_share_name_index(deck):
+    """Exact names hit the prebuilt index; clones reuse it without rebuilding."""
+    clone = deck.clone()
+    clone.shuffle(seed=1)
+
+    assert clone._name_exact is deck._name_exact
+    assert (
+        lookup_card(clone, "WHEEL OF FORTUNE") is deck._name_exact["wheel of fortune"]
+    )
+    assert [c.name for c in lookup_card(clone, "page of")] == [
+        c.name for c in deck.cards if c.name.startswith("Page of")
+    ]
+
+
+def test_lookup_alias_only_expands_whole_words(deck):
+    """Aliases expand as words; text already saying pentacles is untouched."""
+    assert lookup_card(deck, "Queen of Coins").name == "Queen of Pentacles"
+    assert lookup_card(deck, "queen of pentacles").name == "Queen of Pentacles"
+    assert lookup_card(deck, "queen of coinsx") is None
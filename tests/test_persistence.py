@@ -65,6 +65,23 @@ def test_save_reading_creates_parent_directory(tmp_path, sample_reading):
     assert nested_path.parent.exists()
 
 
+def test_save_recreates_parent_directory_removed_between_saves(
+    tmp_path, sample_reading
+):
+    """A reused instance skips mkdir, but recovers if the directory vanishes."""
+    import shutil
+
+    nested_path = tmp_path / "nested" / "readings.jsonl"
+    persistence = ReadingPersistence(config_override=nested_path)
+    assert persistence.save(sample_reading) is True
+
+    shutil.rmtree(nested_path.parent)
+
+    assert persistence.save(sample_reading) is False  # Warned, not raised
+    assert persistence.save(sample_reading) is True
+    assert nested_path.exists()
+
+
 def test_save_reading_appends_to_existing_file(temp_persistence, sample_reading):
     """Test that multiple saves append to the same file."""
     temp_persistence.save(sample_reading)
@@ -82,12 +99,58 @@ def test_save_reading_appends_to_existing_file(temp_persistence, sample_reading)
         assert data["spread_type"] == "single_card"
 
 
+def test_save_many_appends_readings_in_order(temp_persistence, sample_reading):
+    """save_many writes every reading after existing lines and reports the count."""
+    temp_persistence.save(sample_reading)
+    later = sample_reading.model_copy(update={"timestamp": "2030-01-01T00:00:00"})
+
+    assert temp_persistence.save_many([sample_reading, later]) == 2
+    assert temp_persistence.save_many([]) == 0
+
+    readings = temp_persistence.load_all()
+    assert len(readings) == 3
+    assert readings[-1].timestamp == "2030-01-01T00:00:00"
+
+
+def test_context_manager_appends_through_one_handle(tmp_path, sample_reading):
+    """Saves inside a with-block share one handle and are readable immediately."""
+    persistence = ReadingPersistence(config_override=tmp_path / "sub" / "r.jsonl")
+
+    with persistence:
+        handle = persistence._handle
+        assert persistence.save(sample_reading) is True
+        assert persistence.save_many([sample_reading, sample_reading]) == 2
+        assert persistence._handle is handle
+        assert len(persistence.load_last(5)) == 3
+        assert persistence.flush() is True
+
+        assert persistence.clear_all() is True
+        assert persistence.save(sample_reading) is True  # Reopens per save
+
+    assert persistence._handle is None
+    assert len(persistence.load_all()) == 1
+
+
 def test_load_all_empty_file(temp_persistence):
     """Test loading from non-existent file returns empty list."""
     readings = temp_persistence.load_all()
     assert readings == []
 
 
+def test_load_all_empty_existing_file_and_unterminated_last_line(
+    temp_persistence, sample_reading
+):
+    """An empty file loads nothing; a last line without a newline still loads."""
+    temp_persistence.readings_path.write_bytes(b"")
+    assert temp_persistence.load_all() == []
+
+    temp_persistence.save(sample_reading)
+    data = temp_persistence.readings_path.read_bytes()
+    temp_persistence.readings_path.write_bytes(data + data.rstrip(b"\n"))
+
+    assert len(temp_persistence.load_all()) == 2
+
+
 def test_load_all_returns_readings(temp_persistence, sample_reading):
     """Test loading all readings from file."""
     # Save multiple readings
@@ -101,6 +164,37 @@ def test_load_all_returns_readings(temp_persistence, sample_reading):
     assert readings[0].spread_type == "single_card"
 
 
+def test_load_all_validates_drawn_cards(temp_persistence, sample_reading):
+    """Drawn cards load as DrawnCard; an invalid nested card field skips the line."""
+    temp_persistence.save(sample_reading)
+    bad = json.loads(sample_reading.model_dump_json())
+    bad["cards"][0]["reversed"] = "sideways"
+    with open(temp_persistence.readings_path, "a") as f:
+        f.write(json.dumps(bad) + "\n")
+
+    readings = temp_persistence.load_all()
+
+    assert len(readings) == 1
+    assert isinstance(readings[0].cards[0], DrawnCard)
+    assert readings[0].cards == sample_reading.cards
+
+
+def test_loaded_readings_share_equal_cards(temp_persistence, sample_reading):
+    """Equal cards across loaded readings are one instance; edited copies aren't."""
+    edited = sample_reading.model_copy(deep=True)
+    edited.cards[0].card = edited.cards[0].card.model_copy(
+        update={"upright_meaning": "Edited"}
+    )
+    temp_persistence.save_many([sample_reading, sample_reading, edited])
+
+    first, second, third = temp_persistence.load_all()
+
+    assert first.cards[0].card is second.cards[0].card
+    assert third.cards[0].card.upright_meaning == "Edited"
+    recent = temp_persistence.load_last(3)
+    assert recent[0].cards[0].card is recent[1].cards[0].card
+
+
 def test_load_all_skips_malformed_lines(temp_persistence, sample_reading):
     """Test that load_all gracefully skips malformed JSON lines."""
     # Save valid reading
@@ -166,6 +260,49 @@ def test_load_last_empty_file(temp_persistence):
     assert recent == []
 
 
+def test_load_last_only_parses_tail(temp_persistence, sample_reading, capsys):
+    """load_last should not parse (or warn about) lines before the last N."""
+    with open(temp_persistence.readings_path, "w") as f:
+        f.write("invalid json line\n")
+    temp_persistence.save(sample_reading)
+    temp_persistence.save(sample_reading)
+
+    recent = temp_persistence.load_last(2)
+
+    assert len(recent) == 2
+    assert "Skipping invalid reading" not in capsys.readouterr().out
+
+
+def test_load_last_reads_back_across_blocks(
+    temp_persistence, sample_reading, capsys, monkeypatch
+):
+    """Tail reads grow past small blocks and still report absolute line numbers."""
+    monkeypatch.setattr("tarotcli.persistence._TAIL_BLOCK_SIZE", 64)
+    for _ in range(5):
+        temp_persistence.save(sample_reading)
+    with open(temp_persistence.readings_path, "a") as f:
+        f.write("invalid json line\n\n")
+    temp_persistence.save(sample_reading)
+
+    recent = temp_persistence.load_last(4)
+
+    assert len(recent) == 3
+    assert recent[-1] == sample_reading
+    assert "Skipping invalid reading at line 6" in capsys.readouterr().out
+
+
+def test_count_matches_stored_lines(temp_persistence, sample_reading):
+    """count() reports stored readings without loading them."""
+    assert temp_persistence.count() == 0
+
+    for _ in range(3):
+        temp_persistence.save(sample_reading)
+    with open(temp_persistence.readings_path, "a") as f:
+        f.write("\n")
+
+    assert temp_persistence.count() == 3
+
+
 def test_clear_all_deletes_file(temp_persistence, sample_reading):
     """Test that clear_all removes the readings file."""
     temp_persistence.save(sample_reading)
@@ -205,6 +342,18 @@ def test_reading_roundtrip(temp_persistence, sample_reading):
     assert loaded.static_interpretation == sample_reading.static_interpretation
 
 
+def test_save_omits_none_fields_and_loads_defaults(temp_persistence, sample_reading):
+    """Null question/interpretation are left out of the line and load back as None."""
+    sample_reading.question = None
+    temp_persistence.save(sample_reading)
+
+    data = json.loads(temp_persistence.readings_path.read_text())
+    assert "question" not in data
+    assert "interpretation" not in data
+
+    assert temp_persistence.load_all()[0] == sample_reading
+
+
 def test_timestamp_preserved(temp_persistence, sample_reading):
     """Test that timestamp is preserved during save/load."""
     temp_persistence.save(sample_reading)
@@ -365,3 +514,22 @@ def test_delete_last_rewrites_file_correctly(temp_persistence, sample_reading):
     for line in lines:
         data = json.loads(line)
         assert "spread_type" in data
+
+
+def test_delete_last_truncates_without_rewriting_older_lines(
+    temp_persistence, sample_reading, monkeypatch
+):
+    """delete_last trims the tail in place, leaving earlier bytes untouched."""
+    monkeypatch.setattr("tarotcli.persistence._TAIL_BLOCK_SIZE", 64)
+    with open(temp_persistence.readings_path, "w") as f:
+        f.write("legacy line kept as-is\n\n")
+    temp_persistence.save(sample_reading)
+    head = temp_persistence.readings_path.read_bytes()
+    for _ in range(3):
+        temp_persistence.save(sample_reading)
+
+    assert temp_persistence.delete_last(3) is True
+    assert temp_persistence.readings_path.read_bytes() == head
+
+    assert temp_persistence.delete_last(2) is True
+    assert not temp_persistence.readings_path.exists()
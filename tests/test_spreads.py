@@ -9,6 +9,12 @@ def test_spread_layout_card_count():
     assert CELTIC_CROSS.card_count() == 10
 
 
+def test_spread_layout_is_frozen():
+    """Registered layouts can't be altered in place."""
+    with pytest.raises(AttributeError):
+        THREE_CARD.display_name = "Changed"
+
+
 def test_get_spread_returns_correct_layout():
     """get_spread() retrieves correct spread by name."""
     spread = get_spread("three")